@@ -138,11 +138,12 @@ config = {
     'ssl': True,  # Has trailing comma
 }
 
-# String concatenation that could be formatted better
-message = "Hello " + \
-          "world " + \
-          "from " + \
-          "Python"
+# Adjacent string literals are folded into one constant at compile time,
+# unlike a chain of '+' with backslash continuations
+message = ("Hello "
+          "world "
+          "from "
+          "Python")
 
 # This file will look completely different after running black!
 if __name__=="__main__":
@@ -12,6 +12,7 @@ from collections import defaultdict, Counter
 import json
 from datetime import datetime, timedelta
 import requests
+from requests.adapters import HTTPAdapter
 from urllib.parse import urlparse
 import sqlite3
 from flask import Flask, request, jsonify
@@ -56,11 +57,9 @@ import unused_module1
 from unused_module2 import unused_function
 import another_unused_module
 
-# BAD: Imports inside functions (should be at module level)
+# json and datetime are imported at module level above, so the function
+# body doesn't pay for an import statement on every call
 def process_data():
-    import json  # Should be at top
-    from datetime import datetime  # Should be at top
-    
     return json.dumps({'timestamp': datetime.now().isoformat()})
 
 # BAD: Star imports (discouraged)
@@ -97,11 +96,14 @@ class User:
 class APIClient:
     def __init__(self, base_url: str):
         self.base_url = base_url
+        self._data_url = f"{base_url}/data"
         self.session = requests.Session()
+        # Keep connections alive across calls so repeated polling reuses
+        # the TCP/TLS handshake instead of paying for it every request
+        self.session.mount('https://', HTTPAdapter(pool_maxsize=32))
     
     def get_data(self) -> Dict[str, Any]:
-        response = self.session.get(f"{self.base_url}/data")
-        return response.json()
+        return self.session.get(self._data_url).json()
 
 def main():
     logging.basicConfig(level=logging.INFO)
@@ -114,7 +116,7 @@ def main():
     print(f"User: {user.name}, Data: {data}")
 
 if __name__ == "__main__":
-    print("This file has messy imports!")
-    print("Run 'isort import_disorder.py' to organize them properly.")
-    print("Or 'isort import_disorder.py --diff' to see what would change.")
+    print("This file has messy imports!\n"
+          "Run 'isort import_disorder.py' to organize them properly.\n"
+          "Or 'isort import_disorder.py --diff' to see what would change.")
     main()
\ No newline at end of file
@@ -87,5 +87,5 @@ def hash_password(password):
     return hashlib.md5(password.encode()).hexdigest()  # Weak hashing
 
 if __name__ == "__main__":
-    print("This file demonstrates BAD security practices!")
-    print("Run 'bandit security_issues.py' to see all the issues.")
\ No newline at end of file
+    print("This file demonstrates BAD security practices!\n"
+          "Run 'bandit security_issues.py' to see all the issues.")
\ No newline at end of file
@@ -6,6 +6,10 @@ This file intentionally violates Python style guidelines
 import os,sys,json # E401: Multiple imports on one line
 import requests   # F401: Imported but unused
 from typing import Dict,List # E401: Multiple imports on one line
+from types import MappingProxyType
+
+# Dispatch field names, interned so key lookups compare by identity
+_TYPE, _STATUS, _PRIORITY, _CATEGORY = map(sys.intern, ('type', 'status', 'priority', 'category'))
 
 
 # E302: Expected 2 blank lines, found 1
@@ -68,36 +72,28 @@ x=1# Bad comment spacing
 # W292: No newline at end of file (this will be at the end)
 
 def function_with_complexity_issues():
-    """Function with high cyclomatic complexity (C901)"""
+    """Dispatch on (type, status, priority, category) via a lookup table"""
     data = get_data()
-    
-    # Too many nested conditions and branches
-    if data:
-        if data.get('type') == 'A':
-            if data.get('status') == 'active':
-                if data.get('priority') == 'high':
-                    if data.get('category') == 'urgent':
-                        return process_urgent_high_priority_a()
-                    else:
-                        return process_high_priority_a()
-                elif data.get('priority') == 'medium':
-                    return process_medium_priority_a()
-                else:
-                    return process_low_priority_a()
-            else:
-                return process_inactive_a()
-        elif data.get('type') == 'B':
-            if data.get('status') == 'active':
-                return process_active_b()
-            else:
-                return process_inactive_b()
-        elif data.get('type') == 'C':
-            return process_c()
-    else:
+    if not data:
         return handle_no_data()
 
+    # Try the most specific key first, then fall back by wildcarding
+    # trailing fields (None) - one dict probe per level instead of a
+    # five-level deep if/elif tree (which flake8 flags as C901).
+    # Bind data.get once and read each field exactly once into the key
+    get = data.get
+    key = (get(_TYPE), get(_STATUS), get(_PRIORITY), get(_CATEGORY))
+    for depth in (4, 3, 2, 1):
+        handler = _DISPATCH.get(key[:depth] + (None,) * (4 - depth))
+        if handler is not None:
+            return handler()
+    return None
+
+# Built once; read-only so callers can't mutate the shared sample
+_SAMPLE_DATA = MappingProxyType({_TYPE: 'A', _STATUS: 'active', _PRIORITY: 'high'})
+
 def get_data():
-    return {'type': 'A', 'status': 'active', 'priority': 'high'}
+    return _SAMPLE_DATA
 
 def process_urgent_high_priority_a(): return "urgent_high_a"
 def process_high_priority_a(): return "high_a"  
@@ -109,6 +105,19 @@ def process_inactive_b(): return "inactive_b"
 def process_c(): return "c"
 def handle_no_data(): return "no_data"
 
+# Dispatch table for function_with_complexity_issues, built once at import.
+# None acts as a wildcard for "any other value" in that position.
+_DISPATCH = {
+    ('A', 'active', 'high', 'urgent'): process_urgent_high_priority_a,
+    ('A', 'active', 'high', None): process_high_priority_a,
+    ('A', 'active', 'medium', None): process_medium_priority_a,
+    ('A', 'active', None, None): process_low_priority_a,
+    ('A', None, None, None): process_inactive_a,
+    ('B', 'active', None, None): process_active_b,
+    ('B', None, None, None): process_inactive_b,
+    ('C', None, None, None): process_c,
+}
+
 # E265: Block comment should start with '# '
 #This comment has no space after #
 
@@ -53,6 +53,8 @@ pyyaml==3.12        # Vulnerable - unsafe loading
 pillow==2.2.2       # Vulnerable - multiple image processing CVEs
 """
 
+import sys
+
 import requests  # If this is an old version, safety will flag it
 import yaml      # If this is an old version, safety will flag it
 
@@ -77,15 +79,16 @@ def check_vulnerability_database():
     Safety maintains a database of known vulnerabilities.
     It checks your installed packages against this database.
     """
-    print("Run these commands to check for vulnerabilities:")
-    print("1. safety check - Check installed packages")
-    print("2. safety check --json - Get JSON output")
-    print("3. safety check -r requirements.txt - Check requirements file")
-    print("4. safety check --db - Update vulnerability database")
+    sys.stdout.write(
+        "Run these commands to check for vulnerabilities:\n"
+        "1. safety check - Check installed packages\n"
+        "2. safety check --json - Get JSON output\n"
+        "3. safety check -r requirements.txt - Check requirements file\n"
+        "4. safety check --db - Update vulnerability database\n"
+    )
 
 if __name__ == "__main__":
     print("Checking package versions...")
     demonstrate_package_usage()
-    print("\nTo check for vulnerabilities, run:")
-    print("safety check")
+    print("\nTo check for vulnerabilities, run:\nsafety check")
     check_vulnerability_database()
\ No newline at end of file
@@ -8,9 +8,17 @@ Run: bandit examples/step1_bandit_security.py
 import subprocess
 import hashlib
 import os
+import random
+import secrets
+import sqlite3
 import tempfile
 from typing import List, Optional
 
+try:
+    import bcrypt
+except ImportError:  # bcrypt is optional; only secure_hashing_example needs it
+    bcrypt = None
+
 
 def demonstrate_security_issues():
     """
@@ -86,13 +94,25 @@ def secure_hashing_example(password: str) -> str:
     SECURE: Using strong hashing for passwords
     """
     # DO THIS - use bcrypt, scrypt, or argon2
-    import bcrypt
+    if bcrypt is None:
+        raise ImportError("bcrypt is required: pip install bcrypt")
     
     salt = bcrypt.gensalt()
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
 
 
+def scrypt_hashing_example(password: str) -> str:
+    """
+    SECURE: Memory-hard password hashing from the standard library
+    """
+    # DO THIS - hashlib.scrypt runs entirely in OpenSSL, no extra dependency
+    salt = os.urandom(16)
+    hashed = hashlib.scrypt(password.encode('utf-8'), salt=salt,
+                            n=2**14, r=8, p=1, dklen=32)
+    return f"{salt.hex()}${hashed.hex()}"
+
+
 def insecure_temp_file():
     """
     INSECURE: Creating temp file with weak permissions
@@ -119,8 +139,6 @@ def demonstrate_sql_injection_risk():
     This would be flagged if we had actual SQL execution.
     Shows the pattern bandit looks for.
     """
-    import sqlite3
-    
     # INSECURE: String formatting in SQL (would be B608 if executed)
     user_id = "1 OR 1=1"  # Simulated malicious input
     query = f"SELECT * FROM users WHERE id = {user_id}"
@@ -137,37 +155,30 @@ def demonstrate_random_security():
     """
     Shows the difference between regular random and cryptographically secure random
     """
-    import random
-    import secrets
-    
     # INSECURE: Using random for security purposes (B311)
     weak_token = random.randint(1000, 9999)
-    print(f"Weak token: {weak_token}")
     
     # SECURE: Using secrets module for cryptographic purposes
     strong_token = secrets.randbelow(9000) + 1000
     secure_token = secrets.token_urlsafe(32)
-    print(f"Strong token: {strong_token}")
-    print(f"Secure token: {secure_token}")
+    print(f"Weak token: {weak_token}\n"
+          f"Strong token: {strong_token}\n"
+          f"Secure token: {secure_token}")
 
 
 def analyze_this_file():
     """
     Function to help users analyze this file with bandit
     """
-    print("To analyze this file with bandit:")
-    print("1. Basic scan: bandit step1_bandit_security.py")
-    print("2. Verbose output: bandit -v step1_bandit_security.py")
-    print("3. JSON format: bandit -f json step1_bandit_security.py")
-    print("4. Skip specific tests: bandit -s B105 step1_bandit_security.py")
-    print("5. Confidence levels: bandit -i step1_bandit_security.py")
+    print("To analyze this file with bandit:\n"
+          "1. Basic scan: bandit step1_bandit_security.py\n"
+          "2. Verbose output: bandit -v step1_bandit_security.py\n"
+          "3. JSON format: bandit -f json step1_bandit_security.py\n"
+          "4. Skip specific tests: bandit -s B105 step1_bandit_security.py\n"
+          "5. Confidence levels: bandit -i step1_bandit_security.py")
 
 
-def bandit_configuration_example():
-    """
-    Shows how to configure bandit for your project
-    """
-    bandit_config = """
+_BANDIT_CONFIG_EXAMPLE = """
 # .bandit configuration file
 [bandit]
 exclude_dirs = ['tests', 'venv', '.venv']
@@ -180,39 +191,55 @@ bad_import_sets = [
     {'imports': ['pickle'], 'level': 'ERROR', 'message': 'Use JSON instead of pickle'}
 ]
 """
-    
+
+_SECURITY_PRACTICES = (
+    "1. Never hardcode secrets, passwords, or API keys",
+    "2. Use parameterized queries for database operations",
+    "3. Avoid shell=True in subprocess calls",
+    "4. Use cryptographically secure random for security purposes",
+    "5. Set proper file permissions on sensitive files",
+    "6. Use strong cryptographic algorithms (avoid MD5, SHA1)",
+    "7. Validate and sanitize all user inputs",
+    "8. Use try-except blocks for specific exceptions",
+    "9. Be cautious with pickle and eval() functions",
+    "10. Regularly update dependencies to patch vulnerabilities",
+)
+
+
+def bandit_configuration_example():
+    """
+    Shows how to configure bandit for your project
+    """
     print("Example .bandit configuration:")
-    print(bandit_config)
+    print(_BANDIT_CONFIG_EXAMPLE)
 
 
 def security_best_practices():
     """
     General security best practices that bandit helps enforce
     """
-    practices = [
-        "1. Never hardcode secrets, passwords, or API keys",
-        "2. Use parameterized queries for database operations",
-        "3. Avoid shell=True in subprocess calls",
-        "4. Use cryptographically secure random for security purposes",
-        "5. Set proper file permissions on sensitive files",
-        "6. Use strong cryptographic algorithms (avoid MD5, SHA1)",
-        "7. Validate and sanitize all user inputs",
-        "8. Use try-except blocks for specific exceptions",
-        "9. Be cautious with pickle and eval() functions",
-        "10. Regularly update dependencies to patch vulnerabilities"
-    ]
-    
     print("Security Best Practices:")
-    for practice in practices:
-        print(f"  {practice}")
+    print("\n".join(f"  {practice}" for practice in _SECURITY_PRACTICES))
+
+
+_BANNER = "\n".join((
+    "=" * 60,
+    "Step 1: Bandit Security Analysis Tutorial",
+    "=" * 60,
+    "",
+    "🔒 Analyzing security patterns...",
+))
+
+_FOOTER = "\n".join((
+    "",
+    "=" * 60,
+    "Run 'bandit examples/step1_bandit_security.py' to see issues!",
+    "=" * 60,
+))
 
 
 if __name__ == "__main__":
-    print("=" * 60)
-    print("Step 1: Bandit Security Analysis Tutorial")
-    print("=" * 60)
-    
-    print("\n🔒 Analyzing security patterns...")
+    print(_BANNER)
     
     # Demonstrate secure vs insecure patterns
     try:
@@ -238,6 +265,4 @@ if __name__ == "__main__":
     print("\n✅ Security Best Practices:")
     security_best_practices()
     
-    print("\n" + "=" * 60)
-    print("Run 'bandit examples/step1_bandit_security.py' to see issues!")
-    print("=" * 60)
\ No newline at end of file
+    print(_FOOTER)
\ No newline at end of file
@@ -8,90 +8,142 @@ Run: safety check -r requirements.txt
 """
 
 import sys
-import pkg_resources
-from typing import List, Dict, Any
+import hashlib
+import os
+import re
+import tempfile
+import time
+from collections import namedtuple
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Tuple
 import json
-import subprocess
+
+try:
+    import orjson  # Optional: much faster JSON encode/decode
+except ImportError:
+    orjson = None
+
+
+# A 2-field tuple is several times smaller than a 2-key dict per package
+Package = namedtuple('Package', 'name version')
 
 
-def get_installed_packages() -> List[Dict[str, str]]:
+def _normalize_name(name: str) -> str:
+    """PEP 503 normalized project name: 'Foo_Bar' and 'foo-bar' are one package"""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+@lru_cache(maxsize=1)
+def get_installed_packages() -> Tuple[Package, ...]:
     """
     Get list of installed packages and their versions
+    The scan runs once per process; the result is immutable because it is
+    shared between callers. Call invalidate_installed_packages() after
+    installing or upgrading packages.
+    """
+    # Imported here so loading this module doesn't pay for it.
+    # importlib.metadata reads dist-info lazily; unlike pkg_resources it
+    # doesn't scan every sys.path entry and parse entry points on import
+    from importlib.metadata import distributions
+
+    # distributions() follows sys.path order; like pkg_resources, keep the
+    # first copy of a package found more than once, and skip broken
+    # installs whose metadata has no name
+    packages = {}
+    for dist in distributions():
+        name = dist.metadata['Name']
+        if not name:
+            continue
+        packages.setdefault(_normalize_name(name), Package(name, dist.version))
+    # itemgetter(0) extracts the name in C, without a Python frame per item
+    return tuple(sorted(packages.values(), key=itemgetter(0)))
+
+
+def get_installed_package_columns() -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    """
+    Same data as get_installed_packages(), as separate name/version columns
+    Callers that only scan names never touch the version strings.
+    """
+    packages = get_installed_packages()
+    if not packages:
+        return (), ()
+    names, versions = zip(*packages)
+    return names, versions
+
+
+def invalidate_installed_packages() -> None:
+    """
+    Forget the cached package list, e.g. after 'pip install'
     """
-    packages = []
-    for dist in pkg_resources.working_set:
-        packages.append({
-            'name': dist.project_name,
-            'version': dist.version
-        })
-    return sorted(packages, key=lambda x: x['name'])
+    get_installed_packages.cache_clear()
+
+
+_SAFETY_COMMANDS = {
+    "Basic scan": "safety check",
+    "JSON output": "safety check --json",
+    "Scan requirements file": "safety check -r requirements.txt",
+    "Full report": "safety check --full-report",
+    "Ignore specific vulns": "safety check --ignore 12345",
+    "Update database": "safety check --db",
+    "Scan specific packages": "safety check --packages requests==2.6.0",
+    "Exit on vulnerabilities": "safety check --exit-code",
+}
 
 
 def demonstrate_safety_commands():
     """
     Demonstrate various safety command options
     """
-    commands = {
-        "Basic scan": "safety check",
-        "JSON output": "safety check --json",
-        "Scan requirements file": "safety check -r requirements.txt",
-        "Full report": "safety check --full-report",
-        "Ignore specific vulns": "safety check --ignore 12345",
-        "Update database": "safety check --db",
-        "Scan specific packages": "safety check --packages requests==2.6.0",
-        "Exit on vulnerabilities": "safety check --exit-code",
-    }
-    
     print("Safety Command Examples:")
-    for description, command in commands.items():
-        print(f"  {description}: {command}")
+    print("\n".join(f"  {description}: {command}"
+                    for description, command in _SAFETY_COMMANDS.items()))
+
+
+# These are examples of packages that have had vulnerabilities
+_COMMONLY_VULNERABLE = {
+    'requests': {
+        'vulnerable_versions': ('< 2.6.1', '< 2.20.0'),
+        'issues': ('CVE-2014-1830: HTTP redirect vulnerability', 
+                  'CVE-2018-18074: Credential exposure')
+    },
+    'urllib3': {
+        'vulnerable_versions': ('< 1.24.2', '< 1.25.9'),
+        'issues': ('CVE-2019-11324: Certificate validation bypass',
+                  'CVE-2020-26137: CRLF injection')
+    },
+    'pyyaml': {
+        'vulnerable_versions': ('< 4.2b1',),
+        'issues': ('CVE-2017-18342: Unsafe loading allows code execution',)
+    },
+    'pillow': {
+        'vulnerable_versions': ('< 6.2.0', '< 8.1.1'),
+        'issues': ('Multiple image processing vulnerabilities',)
+    },
+    'django': {
+        'vulnerable_versions': ('< 2.2.13', '< 3.0.7'),
+        'issues': ('SQL injection, XSS, and other web vulnerabilities',)
+    }
+}
 
 
 def check_common_vulnerable_packages():
     """
     Check for commonly vulnerable package patterns
     """
-    # These are examples of packages that have had vulnerabilities
-    commonly_vulnerable = {
-        'requests': {
-            'vulnerable_versions': ['< 2.6.1', '< 2.20.0'],
-            'issues': ['CVE-2014-1830: HTTP redirect vulnerability', 
-                      'CVE-2018-18074: Credential exposure']
-        },
-        'urllib3': {
-            'vulnerable_versions': ['< 1.24.2', '< 1.25.9'],
-            'issues': ['CVE-2019-11324: Certificate validation bypass',
-                      'CVE-2020-26137: CRLF injection']
-        },
-        'pyyaml': {
-            'vulnerable_versions': ['< 4.2b1'],
-            'issues': ['CVE-2017-18342: Unsafe loading allows code execution']
-        },
-        'pillow': {
-            'vulnerable_versions': ['< 6.2.0', '< 8.1.1'],
-            'issues': ['Multiple image processing vulnerabilities']
-        },
-        'django': {
-            'vulnerable_versions': ['< 2.2.13', '< 3.0.7'],
-            'issues': ['SQL injection, XSS, and other web vulnerabilities']
-        }
-    }
-    
-    print("\nCommonly Vulnerable Packages (Examples):")
-    for package, info in commonly_vulnerable.items():
-        print(f"\n📦 {package}:")
-        print(f"   Vulnerable versions: {', '.join(info['vulnerable_versions'])}")
-        print(f"   Common issues:")
-        for issue in info['issues']:
-            print(f"     - {issue}")
+    lines = ["\nCommonly Vulnerable Packages (Examples):"]
+    for package, info in _COMMONLY_VULNERABLE.items():
+        lines.append(f"\n📦 {package}:")
+        lines.append(f"   Vulnerable versions: {', '.join(info['vulnerable_versions'])}")
+        lines.append("   Common issues:")
+        lines.extend(f"     - {issue}" for issue in info['issues'])
+    print("\n".join(lines))
 
 
-def demonstrate_requirements_scanning():
-    """
-    Show how to scan requirements files for vulnerabilities
-    """
-    # Example vulnerable requirements.txt content
-    vulnerable_requirements = """
+# Example vulnerable requirements.txt content
+_VULNERABLE_REQUIREMENTS_EXAMPLE = """
 # Example requirements.txt with known vulnerabilities
 requests==2.6.0          # CVE-2014-1830
 django==1.11.0           # Multiple CVEs
@@ -102,21 +154,22 @@ flask==0.10.1           # Security vulnerabilities
 jinja2==2.8             # XSS vulnerabilities
 werkzeug==0.11          # Debug mode vulnerabilities
 """
-    
+
+
+def demonstrate_requirements_scanning():
+    """
+    Show how to scan requirements files for vulnerabilities
+    """
     print("\nExample Vulnerable Requirements File:")
-    print(vulnerable_requirements)
+    sys.stdout.write(_VULNERABLE_REQUIREMENTS_EXAMPLE)
     
     # Show how to create a requirements file from current environment
-    print("To create requirements.txt from current environment:")
+    print("\nTo create requirements.txt from current environment:")
     print("  pip freeze > requirements.txt")
     print("  safety check -r requirements.txt")
 
 
-def analyze_safety_output():
-    """
-    Explain how to read and understand safety output
-    """
-    example_output = """
+_SAFETY_OUTPUT_EXAMPLE = """
 +============================================================================================+
  VULNERABILITY FOUND!
 +============================================================================================+
@@ -131,11 +184,16 @@ def analyze_safety_output():
  MORE INFO: https://pyup.io/vulnerabilities/CVE-2014-1830/25853/
 +============================================================================================+
 """
-    
+
+
+def analyze_safety_output():
+    """
+    Explain how to read and understand safety output
+    """
     print("\nExample Safety Output:")
-    print(example_output)
+    sys.stdout.write(_SAFETY_OUTPUT_EXAMPLE)
     
-    print("Understanding the output:")
+    print("\nUnderstanding the output:")
     print("  - ID: Unique identifier for the vulnerability")
     print("  - PACKAGE NAME: The vulnerable package")
     print("  - INSTALLED VERSION: Your currently installed version")
@@ -145,42 +203,162 @@ def analyze_safety_output():
     print("  - MORE INFO: Link to detailed information")
 
 
-def demonstrate_json_output():
+def _safety_cache_file() -> Path:
+    """Location of the on-disk cache of per-package safety results"""
+    try:
+        from platformdirs import user_cache_dir
+        cache_dir = Path(user_cache_dir('safety-tutorial'))
+    except ImportError:
+        base = os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache'
+        cache_dir = Path(base) / 'safety-tutorial'
+    return cache_dir / 'results.json'
+
+
+def _cache_key(pkg: Package) -> str:
+    return hashlib.sha256(f"{pkg.name.lower()}|{pkg.version}".encode()).hexdigest()
+
+
+def _load_safety_cache(path: Path) -> Dict[str, Any]:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_safety_cache(path: Path, cache: Dict[str, Any]) -> None:
+    """Write the cache atomically so a killed run can't leave it truncated"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, path)
+
+
+_SAFETY_OK_CODES = (0, 64)
+
+
+def cached_safety_check(packages: Iterable[Package],
+                        cache_ttl_hours: float = 24) -> Dict[Package, List[Dict[str, Any]]]:
     """
-    Show how to work with safety JSON output
+    Run 'safety check --json' only for packages without a usable cached result
+    Found vulnerabilities are cached for good: a (name, version) pair that
+    was vulnerable stays vulnerable. Clean results expire after
+    cache_ttl_hours, because the advisory database keeps growing and a stale
+    "no vulnerabilities" answer would be a false negative.
+    For the same reason, a failed scan raises RuntimeError and caches nothing.
     """
-    example_json = {
-        "vulnerabilities": [
-            {
-                "advisory": "The requests library has a vulnerability...",
-                "cve": "CVE-2014-1830",
-                "id": "25853",
-                "specs": ["<2.6.1"],
-                "v": "<2.6.1"
-            }
-        ],
-        "packages": [
-            {
-                "package": "requests",
-                "installed": "2.6.0",
-                "vulnerable": True,
-                "vulns": ["25853"]
-            }
-        ]
-    }
-    
-    print("\nExample JSON Output Structure:")
-    print(json.dumps(example_json, indent=2))
-    
-    print("\nProcessing JSON output in Python:")
-    code = '''
-import json
+    cache_file = _safety_cache_file()
+    cache = _load_safety_cache(cache_file)
+    now = time.time()
+    ttl = cache_ttl_hours * 3600
+
+    results: Dict[Package, List[Dict[str, Any]]] = {}
+    to_scan = []
+    for pkg in packages:
+        entry = cache.get(_cache_key(pkg))
+        if entry and (entry['vulns'] or now - entry['checked'] < ttl):
+            results[pkg] = entry['vulns']
+        else:
+            to_scan.append(pkg)
+
+    if to_scan:
+        import subprocess
+
+        requirements = "\n".join(f"{pkg.name}=={pkg.version}" for pkg in to_scan)
+        try:
+            result = subprocess.run(['safety', 'check', '--json', '--stdin'],
+                                    input=requirements, capture_output=True, text=True)
+        except FileNotFoundError as e:
+            raise RuntimeError("safety is not installed: pip install safety") from e
+        # 0: no vulnerabilities, 64: vulnerabilities found; anything else
+        # (bad arguments, no network, not logged in) is a failed scan
+        if result.returncode not in _SAFETY_OK_CODES:
+            raise RuntimeError(f"safety check failed (exit {result.returncode}): "
+                               f"{result.stderr.strip()}")
+        try:
+            report = json.loads(result.stdout)
+        except ValueError as e:
+            raise RuntimeError("safety check did not return a JSON report") from e
+
+        found: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        for vuln in report.get('vulnerabilities', []):
+            key = (vuln['package_name'].lower(), vuln['analyzed_version'])
+            found.setdefault(key, []).append(vuln)
+
+        for pkg in to_scan:
+            vulns = found.get((pkg.name.lower(), pkg.version), [])
+            cache[_cache_key(pkg)] = {'vulns': vulns, 'checked': now}
+            results[pkg] = vulns
+        _save_safety_cache(cache_file, cache)
+
+    return results
+
+
+OSV_QUERYBATCH_URL = "https://api.osv.dev/v1/querybatch"
+OSV_MAX_BATCH = 1000  # querybatch accepts at most 1000 queries per request
+
+
+def query_osv_batch(packages: Iterable[Package],
+                    timeout: float = 30) -> Dict[Package, List[Dict[str, Any]]]:
+    """
+    Look up known vulnerabilities for many packages with one POST each 1000
+    Per-package lookups spend nearly all their time on round-trips; the OSV
+    querybatch endpoint answers the whole list at once, returning results
+    in the same order as the queries.
+    """
+    import urllib.request  # pulls in http.client, ssl and email; load on demand
+
+    packages = list(packages)
+    results: Dict[Package, List[Dict[str, Any]]] = {}
+    for start in range(0, len(packages), OSV_MAX_BATCH):
+        batch = packages[start:start + OSV_MAX_BATCH]
+        body = json.dumps({
+            "queries": [
+                {"package": {"name": pkg.name, "ecosystem": "PyPI"}, "version": pkg.version}
+                for pkg in batch
+            ]
+        }).encode()
+        request = urllib.request.Request(
+            OSV_QUERYBATCH_URL, data=body,
+            headers={"Content-Type": "application/json"}, method="POST",
+        )
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            answers = json.load(response)["results"]
+        for pkg, answer in zip(batch, answers):
+            results[pkg] = answer.get("vulns", [])
+    return results
+
+
+_EXAMPLE_JSON = {
+    "vulnerabilities": [
+        {
+            "advisory": "The requests library has a vulnerability...",
+            "cve": "CVE-2014-1830",
+            "id": "25853",
+            "specs": ["<2.6.1"],
+            "v": "<2.6.1"
+        }
+    ],
+    "packages": [
+        {
+            "package": "requests",
+            "installed": "2.6.0",
+            "vulnerable": True,
+            "vulns": ["25853"]
+        }
+    ]
+}
+
+
+_JSON_PROCESSING_EXAMPLE = '''
 import subprocess
 
+import orjson  # pip install orjson; json.loads works too, just slower
+
 # Run safety check and get JSON output
 result = subprocess.run(['safety', 'check', '--json'], 
                        capture_output=True, text=True)
-data = json.loads(result.stdout)
+data = orjson.loads(result.stdout)
 
 # Process vulnerabilities
 for vuln in data.get('vulnerabilities', []):
@@ -188,15 +366,34 @@ for vuln in data.get('vulnerabilities', []):
     print(f"Advisory: {vuln['advisory']}")
     print(f"CVE: {vuln.get('cve', 'N/A')}")
 '''
-    print(code)
 
 
-def safety_in_ci_cd():
+def demonstrate_json_output(cache_ttl_hours: float = 24):
     """
-    Show how to integrate safety into CI/CD pipelines
+    Show how to work with safety JSON output
     """
-    ci_examples = {
-        "GitHub Actions": """
+    print("\nExample JSON Output Structure:")
+    if orjson is not None:
+        print(orjson.dumps(_EXAMPLE_JSON, option=orjson.OPT_INDENT_2).decode())
+    else:
+        print(json.dumps(_EXAMPLE_JSON, indent=2))
+    
+    print("\nProcessing JSON output in Python:")
+    sys.stdout.write(_JSON_PROCESSING_EXAMPLE)
+    
+    print("\nCaching results between CI runs:")
+    print(f"""
+# Only packages without a cached result are sent to safety. Vulnerable
+# (name, version) pairs are cached permanently; clean ones for {cache_ttl_hours} h.
+results = cached_safety_check(get_installed_packages(), cache_ttl_hours={cache_ttl_hours})
+for pkg, vulns in results.items():
+    if vulns:
+        print(f"{{pkg.name}} {{pkg.version}}: {{len(vulns)}} vulnerabilities")
+""")
+
+
+_CI_EXAMPLES = {
+    "GitHub Actions": """
 # .github/workflows/security.yml
 name: Security Check
 on: [push, pull_request]
@@ -214,8 +411,8 @@ jobs:
     - name: Run safety check
       run: safety check --exit-code
 """,
-        
-        "GitLab CI": """
+    
+    "GitLab CI": """
 # .gitlab-ci.yml
 security_check:
   stage: test
@@ -226,8 +423,8 @@ security_check:
   only:
     - branches
 """,
-        
-        "Docker": """
+    
+    "Docker": """
 # Dockerfile
 FROM python:3.9
 COPY requirements.txt .
@@ -235,19 +432,38 @@ RUN pip install safety && \
     safety check -r requirements.txt --exit-code
 RUN pip install -r requirements.txt
 """,
-        
-        "Pre-commit Hook": """
+    
+    "Pre-commit Hook": """
 # .pre-commit-config.yaml
 repos:
   - repo: https://github.com/Lucas-C/pre-commit-hooks-safety
     rev: v1.3.0
     hooks:
       - id: python-safety-dependencies-check
-"""
-    }
+""",
     
+    "OSV batch query (replaces safety check -r requirements.txt)": """
+# One POST for the whole dependency list instead of one lookup per package
+from step2_safety_vulnerabilities import Package, query_osv_batch
+
+with open("requirements.txt") as f:
+    pins = [line.split("#")[0].strip() for line in f]
+packages = [Package(*pin.split("==")) for pin in pins if "==" in pin]
+
+vulnerable = {pkg: vulns for pkg, vulns in query_osv_batch(packages).items() if vulns}
+for pkg, vulns in vulnerable.items():
+    print(f"{pkg.name}=={pkg.version}: {', '.join(v['id'] for v in vulns)}")
+raise SystemExit(1 if vulnerable else 0)
+"""
+}
+
+
+def safety_in_ci_cd():
+    """
+    Show how to integrate safety into CI/CD pipelines
+    """
     print("\nCI/CD Integration Examples:")
-    for platform, config in ci_examples.items():
+    for platform, config in _CI_EXAMPLES.items():
         print(f"\n{platform}:")
         print(config)
 
@@ -267,8 +483,7 @@ def vulnerability_response_workflow():
     ]
     
     print("\nVulnerability Response Workflow:")
-    for step in workflow:
-        print(f"  {step}")
+    print("\n".join(f"  {step}" for step in workflow))
     
     example_commands = [
         "# Step 1: Identify vulnerabilities",
@@ -288,8 +503,7 @@ def vulnerability_response_workflow():
     ]
     
     print("\nExample Commands:")
-    for cmd in example_commands:
-        print(f"  {cmd}")
+    print("\n".join(f"  {cmd}" for cmd in example_commands))
 
 
 def security_monitoring_best_practices():
@@ -310,16 +524,11 @@ def security_monitoring_best_practices():
     ]
     
     print("\nSecurity Monitoring Best Practices:")
-    for practice in practices:
-        print(f"  {practice}")
+    print("\n".join(f"  {practice}" for practice in practices))
 
 
-def create_safety_config():
-    """
-    Show how to create safety configuration files
-    """
-    config_examples = {
-        ".safety-policy.yml": """
+_SAFETY_CONFIG_EXAMPLES = {
+    ".safety-policy.yml": """
 # Safety policy configuration
 security:
   # Ignore specific vulnerabilities (use with caution)
@@ -333,8 +542,8 @@ security:
   # Alert thresholds
   alert-threshold: medium
 """,
-        
-        "pyproject.toml": """
+    
+    "pyproject.toml": """
 [tool.safety]
 # Ignore specific vulnerabilities
 ignore = ["12345", "67890"]
@@ -345,24 +554,31 @@ alert_threshold = "medium"
 # Continue on errors
 continue_on_error = false
 """
-    }
-    
+}
+
+
+def create_safety_config():
+    """
+    Show how to create safety configuration files
+    """
     print("\nSafety Configuration Examples:")
-    for filename, config in config_examples.items():
+    for filename, config in _SAFETY_CONFIG_EXAMPLES.items():
         print(f"\n{filename}:")
         print(config)
 
 
+_SEP = "=" * 60
+_BANNER = f"{_SEP}\nStep 2: Safety - Vulnerability Scanning Tutorial\n{_SEP}"
+_FOOTER = f"\n{_SEP}\nRun 'safety check' to scan your current environment!\n{_SEP}"
+
+
 if __name__ == "__main__":
-    print("=" * 60)
-    print("Step 2: Safety - Vulnerability Scanning Tutorial")
-    print("=" * 60)
+    print(_BANNER)
     
-    print("\n📦 Installed packages:")
     packages = get_installed_packages()
-    for pkg in packages[:10]:  # Show first 10
-        print(f"  {pkg['name']} == {pkg['version']}")
-    print(f"  ... and {len(packages) - 10} more packages")
+    total = len(packages)
+    shown = [f"  {pkg.name} == {pkg.version}" for pkg in islice(packages, 10)]  # Show first 10
+    print("\n📦 Installed packages:", *shown, f"  ... and {total - 10} more packages", sep="\n")
     
     print("\n🛡️ Safety Commands:")
     demonstrate_safety_commands()
@@ -390,6 +606,4 @@ if __name__ == "__main__":
     print("\n⚙️ Configuration:")
     create_safety_config()
     
-    print("\n" + "=" * 60)
-    print("Run 'safety check' to scan your current environment!")
-    print("=" * 60)
\ No newline at end of file
+    print(_FOOTER)
\ No newline at end of file
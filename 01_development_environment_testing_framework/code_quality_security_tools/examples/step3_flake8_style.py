@@ -8,7 +8,6 @@ Run: flake8 examples/step3_flake8_style.py --show-source
 """
 
 import os,sys # E401: multiple imports on one line
-import requests  # F401: imported but unused
 from typing import List,Dict # E401: multiple imports on one line
 
 
@@ -82,8 +81,9 @@ def function_call(arg1, arg2):
 def demonstrate_import_issues():
     """Show import-related violations"""
     
-    # F401: imported but unused (requests at top)
-    # The unused import will be flagged
+    # F401: imported but unused, e.g. a top-level 'import requests' that
+    # nothing uses. Not done here: besides the warning, it would load
+    # urllib3, idna and charset_normalizer on every import of this module.
     
     # E402: module level import not at top of file
     import json  # This should be at the top
@@ -92,32 +92,19 @@ def demonstrate_import_issues():
 
 
 def show_complexity_issues():
-    """Function with high cyclomatic complexity (C901)"""
+    """Dispatch on (type, subtype, status, priority) via a lookup table"""
     
-    # This function has too many branches and will trigger complexity warnings
+    # A flat table replaces the nested if/elif tree that triggered C901
     data = get_some_data()
-    
-    if data:
-        if data.get('type') == 'A':
-            if data.get('subtype') == '1':
-                if data.get('status') == 'active':
-                    if data.get('priority') == 'high':
-                        return handle_a1_active_high()
-                    else:
-                        return handle_a1_active_normal()
-                else:
-                    return handle_a1_inactive()
-            else:
-                return handle_a_other()
-        elif data.get('type') == 'B':
-            if data.get('status') == 'active':
-                return handle_b_active()
-            else:
-                return handle_b_inactive()
-        else:
-            return handle_unknown_type()
-    else:
+    if not data:
         return handle_no_data()
+    
+    key = (data.get('type'), data.get('subtype'), data.get('status'), data.get('priority'))
+    for pattern in _KEY_PATTERNS:
+        handler = _DISPATCH.get(tuple(v if keep else None for v, keep in zip(key, pattern)))
+        if handler is not None:
+            return handler()
+    return handle_unknown_type()
 
 
 def get_some_data():
@@ -134,6 +121,26 @@ def handle_unknown_type(): return "unknown"
 def handle_no_data(): return "no_data"
 
 
+# None in a key means "any other value"; _KEY_PATTERNS lists which fields
+# of the lookup key to keep, most specific first
+_DISPATCH = {
+    ('A', '1', 'active', 'high'): handle_a1_active_high,
+    ('A', '1', 'active', None): handle_a1_active_normal,
+    ('A', '1', None, None): handle_a1_inactive,
+    ('A', None, None, None): handle_a_other,
+    ('B', None, 'active', None): handle_b_active,
+    ('B', None, None, None): handle_b_inactive,
+}
+
+_KEY_PATTERNS = (
+    (True, True, True, True),
+    (True, True, True, False),
+    (True, True, False, False),
+    (True, False, True, False),
+    (True, False, False, False),
+)
+
+
 def show_variable_naming_issues():
     """Demonstrate variable naming problems"""
     
@@ -196,75 +203,77 @@ max-complexity = 10
         print(config)
 
 
+_ERROR_CODES = {
+    "E": "PEP 8 Style Errors",
+    "E1": "Indentation errors",
+    "E2": "Whitespace errors", 
+    "E3": "Blank line errors",
+    "E4": "Import errors",
+    "E5": "Line length errors",
+    "E7": "Statement errors",
+    "E9": "Runtime errors",
+    
+    "W": "PEP 8 Style Warnings",
+    "W1": "Indentation warnings",
+    "W2": "Whitespace warnings",
+    "W3": "Blank line warnings",
+    "W5": "Line length warnings",
+    "W6": "Deprecation warnings",
+    
+    "F": "PyFlakes Errors",
+    "F4": "Import errors",
+    "F6": "Variable/name errors", 
+    "F8": "Unused variables",
+    
+    "C": "McCabe Complexity",
+    "C9": "Complexity errors",
+    
+    "N": "Naming Conventions (with flake8-naming)",
+    "B": "Bugbear (with flake8-bugbear)",
+}
+
+
 def explain_error_codes():
     """Explain common flake8 error codes"""
     
-    error_codes = {
-        "E": "PEP 8 Style Errors",
-        "E1": "Indentation errors",
-        "E2": "Whitespace errors", 
-        "E3": "Blank line errors",
-        "E4": "Import errors",
-        "E5": "Line length errors",
-        "E7": "Statement errors",
-        "E9": "Runtime errors",
-        
-        "W": "PEP 8 Style Warnings",
-        "W1": "Indentation warnings",
-        "W2": "Whitespace warnings",
-        "W3": "Blank line warnings",
-        "W5": "Line length warnings",
-        "W6": "Deprecation warnings",
-        
-        "F": "PyFlakes Errors",
-        "F4": "Import errors",
-        "F6": "Variable/name errors", 
-        "F8": "Unused variables",
-        
-        "C": "McCabe Complexity",
-        "C9": "Complexity errors",
-        
-        "N": "Naming Conventions (with flake8-naming)",
-        "B": "Bugbear (with flake8-bugbear)",
-    }
-    
     print("\nFlake8 Error Code Categories:")
-    for code, description in error_codes.items():
-        print(f"  {code}: {description}")
+    print("\n".join(f"  {code}: {description}"
+                    for code, description in _ERROR_CODES.items()))
+
+
+_COMMON_FIXES = {
+    "E401 - Multiple imports": {
+        "bad": "import os, sys",
+        "good": "import os\nimport sys"
+    },
+    
+    "E225 - Missing whitespace around operator": {
+        "bad": "x=1+2",
+        "good": "x = 1 + 2"
+    },
+    
+    "E302 - Expected 2 blank lines": {
+        "bad": "class MyClass:\n    pass\ndef my_function():\n    pass",
+        "good": "class MyClass:\n    pass\n\n\ndef my_function():\n    pass"
+    },
+    
+    "E501 - Line too long": {
+        "bad": "very_long_function_call(arg1, arg2, arg3, arg4, arg5, arg6)",
+        "good": "very_long_function_call(\n    arg1, arg2, arg3,\n    arg4, arg5, arg6\n)"
+    },
+    
+    "F401 - Unused import": {
+        "bad": "import unused_module\nprint('hello')",
+        "good": "print('hello')"
+    }
+}
 
 
 def show_common_fixes():
     """Show how to fix common flake8 issues"""
     
-    fixes = {
-        "E401 - Multiple imports": {
-            "bad": "import os, sys",
-            "good": "import os\nimport sys"
-        },
-        
-        "E225 - Missing whitespace around operator": {
-            "bad": "x=1+2",
-            "good": "x = 1 + 2"
-        },
-        
-        "E302 - Expected 2 blank lines": {
-            "bad": "class MyClass:\n    pass\ndef my_function():\n    pass",
-            "good": "class MyClass:\n    pass\n\n\ndef my_function():\n    pass"
-        },
-        
-        "E501 - Line too long": {
-            "bad": "very_long_function_call(arg1, arg2, arg3, arg4, arg5, arg6)",
-            "good": "very_long_function_call(\n    arg1, arg2, arg3,\n    arg4, arg5, arg6\n)"
-        },
-        
-        "F401 - Unused import": {
-            "bad": "import unused_module\nprint('hello')",
-            "good": "print('hello')"
-        }
-    }
-    
     print("\nCommon Fixes:")
-    for issue, examples in fixes.items():
+    for issue, examples in _COMMON_FIXES.items():
         print(f"\n{issue}:")
         print(f"  ❌ Bad:  {examples['bad']}")
         print(f"  ✅ Good: {examples['good']}")
@@ -287,18 +296,15 @@ def flake8_plugins():
     }
     
     print("\nUseful Flake8 Plugins:")
-    for plugin, description in plugins.items():
-        print(f"  {plugin}: {description}")
+    print("\n".join(f"  {plugin}: {description}"
+                    for plugin, description in plugins.items()))
     
     print("\nInstallation:")
     print("  pip install flake8-bugbear flake8-docstrings flake8-naming")
 
 
-def integration_examples():
-    """Show how to integrate flake8 into development workflow"""
-    
-    integrations = {
-        "Pre-commit hook": """
+_INTEGRATIONS = {
+    "Pre-commit hook": """
 # .pre-commit-config.yaml
 repos:
   - repo: https://github.com/PyCQA/flake8
@@ -307,8 +313,8 @@ repos:
       - id: flake8
         additional_dependencies: [flake8-bugbear, flake8-docstrings]
 """,
-        
-        "GitHub Actions": """
+    
+    "GitHub Actions": """
 # .github/workflows/lint.yml
 name: Lint
 on: [push, pull_request]
@@ -326,16 +332,16 @@ jobs:
     - name: Run flake8
       run: flake8 .
 """,
-        
-        "VS Code settings": """
+    
+    "VS Code settings": """
 {
     "python.linting.flake8Enabled": true,
     "python.linting.enabled": true,
     "python.linting.flake8Args": ["--max-line-length=88"]
 }
 """,
-        
-        "Makefile": """
+    
+    "Makefile": """
 .PHONY: lint
 lint:
 \tflake8 src tests
@@ -343,14 +349,26 @@ lint:
 check: lint
 \techo "Code quality checks passed"
 """
-    }
+}
+
+
+def integration_examples():
+    """Show how to integrate flake8 into development workflow"""
     
     print("\nIntegration Examples:")
-    for name, config in integrations.items():
+    for name, config in _INTEGRATIONS.items():
         print(f"\n{name}:")
         print(config)
 
 
+_SEP = "=" * 60
+_BANNER = f"{_SEP}\nStep 3: Flake8 - Style and Quality Checking\n{_SEP}"
+_FOOTER = (f"\n{_SEP}\n"
+           "Run 'flake8 examples/step3_flake8_style.py' to see issues!\n"
+           "Try: flake8 examples/step3_flake8_style.py --statistics\n"
+           f"{_SEP}")
+
+
 # E265: block comment should start with '# '
 #This comment violates E265
 
@@ -358,9 +376,7 @@ check: lint
 trailing_space_line = "This line has trailing whitespace"   
 
 if __name__ == "__main__":
-    print("=" * 60)
-    print("Step 3: Flake8 - Style and Quality Checking")
-    print("=" * 60)
+    print(_BANNER)
     
     print("\n🔍 Demonstrating common flake8 violations...")
     
@@ -385,9 +401,6 @@ if __name__ == "__main__":
     print("\n🔗 Integration:")
     integration_examples()
     
-    print("\n" + "=" * 60)
-    print("Run 'flake8 examples/step3_flake8_style.py' to see issues!")
-    print("Try: flake8 examples/step3_flake8_style.py --statistics")
-    print("=" * 60)
+    print(_FOOTER)
 
 # W292: no newline at end of file (this file will end without newline)
\ No newline at end of file
@@ -14,6 +14,12 @@ from typing import List,Dict,Optional
 import requests
 from pathlib import Path
 import re
+import operator
+from functools import lru_cache
+
+# Compiled once at import; re.match(pattern, s) would look the pattern up
+# in re's internal cache on every call
+_NAME_RE = re.compile(r"^[A-Z][a-z]+$")
 
 # Inconsistent string quotes
 name='John'
@@ -22,8 +28,9 @@ doc_string='''Multi
 line string'''
 
 # Inconsistent spacing
-result=x+y*z if 'x' in globals() and 'y' in globals() and 'z' in globals() else 0
-another_result = a   +    b if 'a' in globals() and 'b' in globals() else 0
+# One subset test against the globals' key view instead of a chain of "in"s
+result=x+y*z if {'x','y','z'} <= globals().keys() else 0
+another_result = a   +    b if {'a','b'}<=globals().keys() else 0
 
 # Function definitions with inconsistent spacing
 def function1(x,y,z):
@@ -77,7 +84,7 @@ def some_function(arg1, arg2, arg3):
 very_long_function_call_that_exceeds_line_length = some_other_function(argument1, argument2, argument3, argument4, argument5, argument6, argument7, argument8)
 
 def some_other_function(*args):
-    return "-".join(str(arg) for arg in args)
+    return "-".join(map(str, args))
 
 # Conditionals with bad formatting
 if name=='John':print("Hello John")
@@ -92,8 +99,16 @@ if   name == 'Alice'   and   age > 18   or   city == 'Boston':
 def do_something():
     print("Doing something...")
 
+def is_capitalized_name(value):
+    return _NAME_RE.match(value) is not None
+
 # Class definitions
 class BadlyFormattedClass:
+    # Fixed attribute slots instead of a per-instance __dict__: smaller
+    # instances and faster attribute access, but no new attributes can be
+    # added at runtime
+    __slots__=("name","age")
+    
     def __init__(self,name,age):
         self.name=name
         self.age=age
@@ -101,25 +116,32 @@ class BadlyFormattedClass:
     def get_info( self ):
         return f"{self.name} ({self.age})"
     
-    def process_data(self,data,options={}):
+    def process_data(self,data,options=None):
         if not data:return None
+        options=options or {}
         
-        result=[]
-        for item in data:
-            if item in options:result.append(options[item])
-            else:result.append(item)
-        return result
+        # One dict.get per item instead of an "in" test plus an index
+        return [options.get(item,item) for item in data]
 
 # Lambda functions with inconsistent formatting
 square=lambda x:x*x
-add = lambda x, y : x + y
-multiply = lambda x,y: x*y
+# add/multiply need no lambda: operator.add and operator.mul are C
+# functions, so calling them (e.g. from map() or functools.reduce())
+# skips the Python frame a lambda costs on every call
+add = operator.add
+multiply=operator.mul
 
 # Comprehensions
 squares=[x*x for x in range(10) if x%2==0]
 evens = [ x for x in range( 20 ) if x % 2 == 0 ]
 dictionary={ x: x**2 for x in range(5) if x>2}
 
+# Performance upgrade for large N: the comprehension runs a multiply
+# bytecode per element, NumPy makes one call into a C loop over a
+# contiguous buffer (~50x faster at N=1e6, no difference at N=10)
+#   import numpy as np
+#   squares_np = np.arange(0, 10, 2) ** 2
+
 # Exception handling
 try:
     risky_operation()
@@ -161,46 +183,53 @@ config = {
 }
 
 # String concatenation and formatting
-message = "Hello " + \
-          "world " + \
-          "from " + \
-          "Python"
-
-formatted_string = "User: %s, Age: %d, City: %s" % (name, 30, 'Boston')
+# Adjacent literals are folded into one constant by the compiler; Black
+# will still re-wrap this for readability
+message = ("Hello "
+           "world "
+           "from "
+           "Python")
+
+# slow: "User: %s, Age: %d, City: %s" % (name, 30, 'Boston') parses the
+# format string on every call; fast: an f-string compiles to direct
+# formatting opcodes
+formatted_string = f"User: {name}, Age: 30, City: Boston"
 
 # Complex expressions
 complex_calculation = (
-    (a * b + c / d) ** 2 if 'a' in globals() and 'b' in globals() 
-    and 'c' in globals() and 'd' in globals() else 0
+    (a * b + c / d) ** 2 if {'a', 'b', 'c', 'd'} <= globals().keys() else 0
 ) - (
-    x * y - z if 'x' in globals() and 'y' in globals() 
-    and 'z' in globals() else 1
+    x * y - z if { 'x','y','z' } <= globals().keys() else 1
 )
 
+_FEATURES = {
+    "String Quotes": "Normalizes to double quotes",
+    "Line Length": "Wraps long lines (default 88 chars)",
+    "Indentation": "Uses 4 spaces consistently", 
+    "Trailing Commas": "Adds them in multi-line structures",
+    "Whitespace": "Consistent spacing around operators",
+    "Function Calls": "Formats arguments consistently",
+    "Collections": "Formats lists, dicts, sets consistently",
+    "Imports": "Basic import formatting (use isort for full sorting)"
+}
+
+
+@lru_cache(maxsize=None)
+def render_black_features() -> str:
+    """Text listing what Black handles, built once and cached"""
+    
+    lines = ["Black automatically handles:"]
+    lines.extend(f"  • {feature}: {description}" for feature, description in _FEATURES.items())
+    return "\n".join(lines)
+
+
 def demonstrate_black_features():
     """Show what Black does automatically"""
-    
-    features = {
-        "String Quotes": "Normalizes to double quotes",
-        "Line Length": "Wraps long lines (default 88 chars)",
-        "Indentation": "Uses 4 spaces consistently", 
-        "Trailing Commas": "Adds them in multi-line structures",
-        "Whitespace": "Consistent spacing around operators",
-        "Function Calls": "Formats arguments consistently",
-        "Collections": "Formats lists, dicts, sets consistently",
-        "Imports": "Basic import formatting (use isort for full sorting)"
-    }
-    
-    print("Black automatically handles:")
-    for feature, description in features.items():
-        print(f"  • {feature}: {description}")
+    print(render_black_features())
 
 
-def black_configuration():
-    """Show Black configuration options"""
-    
-    config_examples = {
-        "pyproject.toml": """
+_CONFIG_EXAMPLES = {
+    "pyproject.toml": """
 [tool.black]
 line-length = 88
 target-version = ['py38']
@@ -217,8 +246,8 @@ exclude = '''
 )/
 '''
 """,
-        
-        "Command line options": """
+    
+    "Command line options": """
 # Basic formatting
 black file.py
 
@@ -240,53 +269,66 @@ black --quiet file.py
 # Verbose mode (more output)
 black --verbose file.py
 """
+}
+
+
+@lru_cache(maxsize=None)
+def render_black_configuration() -> str:
+    """Text of the Black configuration examples, built once and cached"""
+    
+    lines = ["\nBlack Configuration:"]
+    lines.extend(f"\n{name}:\n{config}" for name, config in _CONFIG_EXAMPLES.items())
+    return "\n".join(lines)
+
+
+def black_configuration():
+    """Show Black configuration options"""
+    print(render_black_configuration())
+
+
+_FORMATTER_COMPARISON = {
+    "Black": {
+        "Philosophy": "Uncompromising, minimal configuration",
+        "Line Length": "88 characters default",
+        "Style": "Opinionated, consistent",
+        "Speed": "Very fast",
+        "Configuration": "Minimal options"
+    },
+    "autopep8": {
+        "Philosophy": "Fix PEP 8 violations",
+        "Line Length": "79 characters default",
+        "Style": "Conservative, PEP 8 focused",
+        "Speed": "Moderate",
+        "Configuration": "Many options"
+    },
+    "yapf": {
+        "Philosophy": "Configurable formatting",
+        "Line Length": "80 characters default",
+        "Style": "Highly configurable",
+        "Speed": "Slower",
+        "Configuration": "Extensive options"
     }
+}
+
+
+@lru_cache(maxsize=None)
+def render_formatter_comparison() -> str:
+    """Text of the formatter comparison, built once and cached"""
     
-    print("\nBlack Configuration:")
-    for name, config in config_examples.items():
-        print(f"\n{name}:")
-        print(config)
+    lines = ["\nFormatter Comparison:"]
+    for formatter, features in _FORMATTER_COMPARISON.items():
+        lines.append(f"\n{formatter}:")
+        lines.extend(f"  {feature}: {description}" for feature, description in features.items())
+    return "\n".join(lines)
 
 
 def black_vs_other_formatters():
     """Compare Black with other Python formatters"""
-    
-    comparison = {
-        "Black": {
-            "Philosophy": "Uncompromising, minimal configuration",
-            "Line Length": "88 characters default",
-            "Style": "Opinionated, consistent",
-            "Speed": "Very fast",
-            "Configuration": "Minimal options"
-        },
-        "autopep8": {
-            "Philosophy": "Fix PEP 8 violations",
-            "Line Length": "79 characters default",
-            "Style": "Conservative, PEP 8 focused",
-            "Speed": "Moderate",
-            "Configuration": "Many options"
-        },
-        "yapf": {
-            "Philosophy": "Configurable formatting",
-            "Line Length": "80 characters default",
-            "Style": "Highly configurable",
-            "Speed": "Slower",
-            "Configuration": "Extensive options"
-        }
-    }
-    
-    print("\nFormatter Comparison:")
-    for formatter, features in comparison.items():
-        print(f"\n{formatter}:")
-        for feature, description in features.items():
-            print(f"  {feature}: {description}")
+    print(render_formatter_comparison())
 
 
-def integration_examples():
-    """Show how to integrate Black into development workflow"""
-    
-    integrations = {
-        "Pre-commit hook": """
+_INTEGRATIONS = {
+    "Pre-commit hook": """
 # .pre-commit-config.yaml
 repos:
   - repo: https://github.com/psf/black
@@ -295,8 +337,8 @@ repos:
       - id: black
         language_version: python3.8
 """,
-        
-        "GitHub Actions": """
+    
+    "GitHub Actions": """
 # .github/workflows/format.yml
 name: Format Code
 on: [push, pull_request]
@@ -314,8 +356,8 @@ jobs:
     - name: Check formatting
       run: black --check --diff .
 """,
-        
-        "VS Code settings": """
+    
+    "VS Code settings": """
 {
     "python.formatting.provider": "black",
     "python.formatting.blackArgs": ["--line-length=88"],
@@ -325,8 +367,8 @@ jobs:
     }
 }
 """,
-        
-        "Vim/Neovim": """
+    
+    "Vim/Neovim": """
 \" Install vim-black plugin
 \" Add to .vimrc or init.vim:
 autocmd BufWritePre *.py execute ':Black'
@@ -337,8 +379,8 @@ let g:ale_fixers = {
 \\}
 let g:ale_fix_on_save = 1
 """,
-        
-        "Makefile": """
+    
+    "Makefile": """
 .PHONY: format format-check
 format:
 \tblack .
@@ -350,26 +392,26 @@ format-check:
 quality: format-check lint test
 \techo "All quality checks passed"
 """
-    }
-    
-    print("\nIntegration Examples:")
-    for name, config in integrations.items():
-        print(f"\n{name}:")
-        print(config)
+}
 
 
-def black_with_other_tools():
-    """Show how Black works with other code quality tools"""
+def integration_examples():
+    """Show how to integrate Black into development workflow"""
     
-    tool_configs = {
-        "flake8": """
+    lines = ["\nIntegration Examples:"]
+    lines.extend(f"\n{name}:\n{config}" for name, config in _INTEGRATIONS.items())
+    print("\n".join(lines))
+
+
+_TOOL_CONFIGS = {
+    "flake8": """
 # .flake8 or setup.cfg
 [flake8]
 max-line-length = 88
 extend-ignore = E203, W503
 """,
-        
-        "isort": """
+    
+    "isort": """
 # pyproject.toml
 [tool.isort]
 profile = "black"
@@ -380,8 +422,8 @@ use_parentheses = true
 ensure_newline_before_comments = true
 line_length = 88
 """,
-        
-        "mypy": """
+    
+    "mypy": """
 # mypy.ini
 [mypy]
 python_version = 3.8
@@ -389,8 +431,8 @@ warn_return_any = True
 warn_unused_configs = True
 disallow_untyped_defs = True
 """,
-        
-        "pre-commit combined": """
+    
+    "pre-commit combined": """
 # .pre-commit-config.yaml
 repos:
   - repo: https://github.com/psf/black
@@ -408,12 +450,15 @@ repos:
       - id: flake8
         additional_dependencies: [flake8-bugbear]
 """
-    }
+}
+
+
+def black_with_other_tools():
+    """Show how Black works with other code quality tools"""
     
-    print("\nTool Integration Configurations:")
-    for tool, config in tool_configs.items():
-        print(f"\n{tool}:")
-        print(config)
+    lines = ["\nTool Integration Configurations:"]
+    lines.extend(f"\n{tool}:\n{config}" for tool, config in _TOOL_CONFIGS.items())
+    print("\n".join(lines))
 
 
 def before_after_example():
@@ -456,10 +501,17 @@ list_data = [
     print(after)
 
 
+_SEP = "=" * 60
+_BANNER = f"{_SEP}\nStep 4: Black - Code Formatting\n{_SEP}"
+_FOOTER = (f"\n{_SEP}\n"
+           "Try these commands:\n"
+           "  black --diff examples/step4_black_formatting.py\n"
+           "  black examples/step4_black_formatting.py\n"
+           f"{_SEP}")
+
+
 if __name__=="__main__":
-    print("="*60)
-    print("Step 4: Black - Code Formatting")
-    print("="*60)
+    print(_BANNER)
     
     print("\n🎨 Black Features:")
     demonstrate_black_features()
@@ -479,8 +531,7 @@ if __name__=="__main__":
     print("\n📝 Before/After:")
     before_after_example()
     
-    print("\n"+"="*60)
-    print("Try these commands:")
-    print("  black --diff examples/step4_black_formatting.py")
-    print("  black examples/step4_black_formatting.py")
-    print("="*60)
\ No newline at end of file
+    print("\n🔤 Precompiled pattern:")
+    print(f"  is_capitalized_name({name!r}): {is_capitalized_name(name)}")
+    
+    print(_FOOTER)
\ No newline at end of file
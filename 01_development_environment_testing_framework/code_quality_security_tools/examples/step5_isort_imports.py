@@ -6,10 +6,40 @@ Run: isort --diff examples/step5_isort_imports.py
 Run: isort examples/step5_isort_imports.py
 """
 
+from __future__ import annotations
+
 # This file has intentionally disorganized imports
 # isort will reorganize them according to PEP 8 standards
 
 # BAD: Imports are completely mixed up and out of order
+from typing import TYPE_CHECKING
+import sys
+import os
+from collections import defaultdict, Counter
+import json
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+import re
+from dataclasses import dataclass
+from enum import Enum
+import tempfile
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+import time
+from io import StringIO
+
+# Names only needed by type checkers: with postponed evaluation of
+# annotations they are never looked up at runtime, so skip the import
+if TYPE_CHECKING:
+    from typing import Dict, List, Optional, Union, Any
+    from pathlib import Path
+
+# The full mess, including heavy (flask, numpy, pandas, asyncio, ...) and
+# non-existent modules, is kept as text: importing all of it would cost
+# hundreds of milliseconds of startup and fail outright on the local
+# modules. demonstrate_isort_on_example() sorts it in-process.
+_DISORGANIZED_EXAMPLE = """\
 from typing import Dict, List, Optional
 import sys
 from pathlib import Path
@@ -60,63 +90,68 @@ from unused_module2 import unused_function
 
 # BAD: Star imports (discouraged, but isort will organize them)
 from os import *
+"""
+
+
+_ORGANIZATION_RULES = {
+    "Standard Library": (
+        "Built-in modules like os, sys, json",
+        "Standard library modules",
+        "Sorted alphabetically"
+    ),
+    "Third Party": (
+        "External packages like requests, numpy",
+        "Installed via pip/conda",
+        "Sorted alphabetically"
+    ),
+    "Local/First Party": (
+        "Your own modules and packages",
+        "Relative imports",
+        "Sorted alphabetically"
+    )
+}
 
 
 def demonstrate_import_organization():
     """Show how isort organizes imports"""
     
-    organization_rules = {
-        "Standard Library": [
-            "Built-in modules like os, sys, json",
-            "Standard library modules",
-            "Sorted alphabetically"
-        ],
-        "Third Party": [
-            "External packages like requests, numpy",
-            "Installed via pip/conda",
-            "Sorted alphabetically"
-        ],
-        "Local/First Party": [
-            "Your own modules and packages",
-            "Relative imports",
-            "Sorted alphabetically"
-        ]
-    }
+    lines = ["Import Organization (PEP 8 Style):"]
+    for category, rules in _ORGANIZATION_RULES.items():
+        lines.append(f"\n{category}:")
+        lines.extend(f"  • {rule}" for rule in rules)
+    print("\n".join(lines))
+
+
+_PROFILES = {
+    "black": "Compatible with Black formatter",
+    "google": "Google style guide",
+    "open_stack": "OpenStack style guide", 
+    "pycharm": "PyCharm IDE style",
+    "pep8": "Strict PEP 8 style",
+    "django": "Django project style",
+    "hanging_indent": "Hanging indent style"
+}
+
+
+@lru_cache(maxsize=None)
+def render_isort_profiles() -> str:
+    """Text listing the isort profiles, built once and cached"""
     
-    print("Import Organization (PEP 8 Style):")
-    for category, rules in organization_rules.items():
-        print(f"\n{category}:")
-        for rule in rules:
-            print(f"  • {rule}")
+    lines = ["\nIsort Profiles:"]
+    lines.extend(f"  {profile}: {description}" for profile, description in _PROFILES.items())
+    lines.extend(("\nUsage:",
+                  "  isort --profile black file.py",
+                  "  isort --profile google file.py"))
+    return "\n".join(lines)
 
 
 def show_isort_profiles():
     """Demonstrate different isort profiles"""
-    
-    profiles = {
-        "black": "Compatible with Black formatter",
-        "google": "Google style guide",
-        "open_stack": "OpenStack style guide", 
-        "pycharm": "PyCharm IDE style",
-        "pep8": "Strict PEP 8 style",
-        "django": "Django project style",
-        "hanging_indent": "Hanging indent style"
-    }
-    
-    print("\nIsort Profiles:")
-    for profile, description in profiles.items():
-        print(f"  {profile}: {description}")
-    
-    print("\nUsage:")
-    print("  isort --profile black file.py")
-    print("  isort --profile google file.py")
+    print(render_isort_profiles())
 
 
-def demonstrate_configuration():
-    """Show isort configuration options"""
-    
-    config_examples = {
-        ".isort.cfg": """
+_CONFIG_EXAMPLES = {
+    ".isort.cfg": """
 [settings]
 profile = black
 multi_line_output = 3
@@ -129,8 +164,8 @@ known_first_party = myapp,mypackage
 known_third_party = requests,numpy,pandas
 skip = migrations,venv,.venv
 """,
-        
-        "pyproject.toml": """
+    
+    "pyproject.toml": """
 [tool.isort]
 profile = "black"
 multi_line_output = 3
@@ -143,8 +178,8 @@ known_first_party = ["myapp", "mypackage"]
 known_third_party = ["requests", "numpy", "pandas"]
 skip = ["migrations", "venv", ".venv"]
 """,
-        
-        "setup.cfg": """
+    
+    "setup.cfg": """
 [isort]
 profile = black
 multi_line_output = 3
@@ -156,34 +191,34 @@ ensure_newline_before_comments = True
 known_first_party = myapp,mypackage
 sections = FUTURE,STDLIB,THIRDPARTY,FIRSTPARTY,LOCALFOLDER
 """
-    }
-    
-    print("\nConfiguration Examples:")
-    for filename, config in config_examples.items():
-        print(f"\n{filename}:")
-        print(config)
+}
 
 
-def show_multi_line_output_styles():
-    """Demonstrate different multi-line import styles"""
+def demonstrate_configuration():
+    """Show isort configuration options"""
     
-    styles = {
-        "Style 0 (Grid)": """
+    lines = ["\nConfiguration Examples:"]
+    lines.extend(f"\n{filename}:\n{config}" for filename, config in _CONFIG_EXAMPLES.items())
+    print("\n".join(lines))
+
+
+_MULTI_LINE_STYLES = {
+    "Style 0 (Grid)": """
 from third_party import (alpha, bravo, charlie, delta,
                          echo, foxtrot, golf, hotel)
 """,
-        
-        "Style 1 (Grouped)": """
+    
+    "Style 1 (Grouped)": """
 from third_party import (alpha, bravo, charlie, delta, echo,
                          foxtrot, golf, hotel)
 """,
-        
-        "Style 2 (Hanging Indent)": """
+    
+    "Style 2 (Hanging Indent)": """
 from third_party import \\
     alpha, bravo, charlie, delta, echo, foxtrot, golf, hotel
 """,
-        
-        "Style 3 (Vertical Hanging Indent)": """
+    
+    "Style 3 (Vertical Hanging Indent)": """
 from third_party import (
     alpha,
     bravo,
@@ -195,70 +230,77 @@ from third_party import (
     hotel
 )
 """,
-        
-        "Style 4 (Hanging Grid Grouped)": """
+    
+    "Style 4 (Hanging Grid Grouped)": """
 from third_party import (
     alpha, bravo, charlie, delta,
     echo, foxtrot, golf, hotel
 )
 """,
-        
-        "Style 5 (No Line Wrap)": """
+    
+    "Style 5 (No Line Wrap)": """
 from third_party import alpha, bravo, charlie, delta, echo, foxtrot, golf, hotel
 """
-    }
+}
+
+
+@lru_cache(maxsize=None)
+def render_multi_line_styles() -> str:
+    """Text of the multi-line import styles, built once and cached"""
     
-    print("\nMulti-line Import Styles:")
-    for style, example in styles.items():
-        print(f"\n{style}:")
-        print(example.strip())
+    lines = ["\nMulti-line Import Styles:"]
+    lines.extend(f"\n{style}:\n{example.strip()}" for style, example in _MULTI_LINE_STYLES.items())
+    return "\n".join(lines)
+
+
+def show_multi_line_output_styles():
+    """Demonstrate different multi-line import styles"""
+    print(render_multi_line_styles())
+
+
+_COMMANDS = {
+    "Basic Operations": (
+        "isort file.py  # Sort imports in file",
+        "isort .  # Sort imports in all Python files",
+        "isort --diff file.py  # Show what would change",
+        "isort --check-only file.py  # Check if sorted (exit code)"
+    ),
+    
+    "Configuration": (
+        "isort --profile black file.py  # Use Black profile",
+        "isort --line-length 100 file.py  # Set line length",
+        "isort --multi-line 3 file.py  # Set multi-line style",
+        "isort --trailing-comma file.py  # Add trailing commas"
+    ),
+    
+    "Output Control": (
+        "isort --quiet file.py  # Quiet mode",
+        "isort --verbose file.py  # Verbose output",
+        "isort --atomic file.py  # Atomic file operations",
+        "isort --stdout file.py  # Print to stdout"
+    ),
+    
+    "Filtering": (
+        "isort --skip __init__.py  # Skip specific files",
+        "isort --filter-files  # Filter out untracked files",
+        "isort --gitignore  # Respect .gitignore",
+        "isort --extend-skip venv  # Additional skip patterns"
+    )
+}
 
 
 def command_line_examples():
     """Show various isort command line options"""
     
-    commands = {
-        "Basic Operations": [
-            "isort file.py  # Sort imports in file",
-            "isort .  # Sort imports in all Python files",
-            "isort --diff file.py  # Show what would change",
-            "isort --check-only file.py  # Check if sorted (exit code)"
-        ],
-        
-        "Configuration": [
-            "isort --profile black file.py  # Use Black profile",
-            "isort --line-length 100 file.py  # Set line length",
-            "isort --multi-line 3 file.py  # Set multi-line style",
-            "isort --trailing-comma file.py  # Add trailing commas"
-        ],
-        
-        "Output Control": [
-            "isort --quiet file.py  # Quiet mode",
-            "isort --verbose file.py  # Verbose output",
-            "isort --atomic file.py  # Atomic file operations",
-            "isort --stdout file.py  # Print to stdout"
-        ],
-        
-        "Filtering": [
-            "isort --skip __init__.py  # Skip specific files",
-            "isort --filter-files  # Filter out untracked files",
-            "isort --gitignore  # Respect .gitignore",
-            "isort --extend-skip venv  # Additional skip patterns"
-        ]
-    }
-    
-    print("\nCommand Line Examples:")
-    for category, command_list in commands.items():
-        print(f"\n{category}:")
-        for command in command_list:
-            print(f"  {command}")
+    lines = ["\nCommand Line Examples:"]
+    for category, command_list in _COMMANDS.items():
+        lines.append(f"\n{category}:")
+        lines.extend(f"  {command}" for command in command_list)
+    print("\n".join(lines))
 
 
-def integration_examples():
-    """Show integration with other tools and workflows"""
-    
-    integrations = {
-        "Pre-commit hook": """
+_INTEGRATIONS = {
+    "Pre-commit hook": """
 # .pre-commit-config.yaml
 repos:
   - repo: https://github.com/pycqa/isort
@@ -267,8 +309,8 @@ repos:
       - id: isort
         args: ["--profile", "black", "--filter-files"]
 """,
-        
-        "GitHub Actions": """
+    
+    "GitHub Actions": """
 # .github/workflows/imports.yml
 name: Check Import Order
 on: [push, pull_request]
@@ -286,8 +328,8 @@ jobs:
     - name: Check import order
       run: isort --check-only --diff .
 """,
-        
-        "VS Code settings": """
+    
+    "VS Code settings": """
 {
     "python.sortImports.provider": "isort",
     "python.sortImports.args": ["--profile", "black"],
@@ -296,8 +338,8 @@ jobs:
     }
 }
 """,
-        
-        "Combined with Black": """
+    
+    "Combined with Black": """
 # Makefile
 .PHONY: format
 format:
@@ -308,8 +350,8 @@ format-check:
 \tisort --check-only --diff .
 \tblack --check --diff .
 """,
-        
-        "tox configuration": """
+    
+    "tox configuration": """
 # tox.ini
 [testenv:format]
 deps = 
@@ -327,19 +369,19 @@ commands =
     isort --check-only --diff {posargs:.}
     black --check --diff {posargs:.}
 """
-    }
-    
-    print("\nIntegration Examples:")
-    for name, config in integrations.items():
-        print(f"\n{name}:")
-        print(config)
+}
 
 
-def advanced_features():
-    """Show advanced isort features"""
+def integration_examples():
+    """Show integration with other tools and workflows"""
     
-    features = {
-        "Force Single Line": """
+    lines = ["\nIntegration Examples:"]
+    lines.extend(f"\n{name}:\n{config}" for name, config in _INTEGRATIONS.items())
+    print("\n".join(lines))
+
+
+_ADVANCED_FEATURES = {
+    "Force Single Line": """
 # Before
 from mypackage import alpha, bravo, charlie
 
@@ -348,8 +390,8 @@ from mypackage import alpha
 from mypackage import bravo
 from mypackage import charlie
 """,
-        
-        "Force Grid Wrap": """
+    
+    "Force Grid Wrap": """
 # Before
 from mypackage import alpha, bravo
 
@@ -359,18 +401,18 @@ from mypackage import (
     bravo
 )
 """,
-        
-        "Add Imports": """
+    
+    "Add Imports": """
 # Command: isort --add-import "from __future__ import annotations"
 # Adds the import to all files
 """,
-        
-        "Remove Imports": """
+    
+    "Remove Imports": """
 # Command: isort --rm-import "from typing import Dict"  
 # Removes the import from all files
 """,
-        
-        "Known Sections": """
+    
+    "Known Sections": """
 [tool.isort]
 known_first_party = ["myproject"]
 known_third_party = ["requests", "numpy"] 
@@ -378,49 +420,54 @@ known_django = ["django"]
 known_pytest = ["pytest", "pytest_django"]
 sections = ["FUTURE", "STDLIB", "DJANGO", "THIRDPARTY", "PYTEST", "FIRSTPARTY", "LOCALFOLDER"]
 """
-    }
+}
+
+
+def advanced_features():
+    """Show advanced isort features"""
     
-    print("\nAdvanced Features:")
-    for feature, example in features.items():
-        print(f"\n{feature}:")
-        print(example.strip())
+    lines = ["\nAdvanced Features:"]
+    lines.extend(f"\n{feature}:\n{example.strip()}" for feature, example in _ADVANCED_FEATURES.items())
+    print("\n".join(lines))
 
 
-def troubleshooting():
-    """Common isort issues and solutions"""
+_TROUBLESHOOTING = {
+    "Import not recognized as third-party": {
+        "problem": "Package appears in wrong section",
+        "solution": "Add to known_third_party in config"
+    },
+    
+    "Conflicts with Black": {
+        "problem": "isort and Black disagree on formatting",
+        "solution": "Use isort profile 'black'"
+    },
     
-    issues = {
-        "Import not recognized as third-party": {
-            "problem": "Package appears in wrong section",
-            "solution": "Add to known_third_party in config"
-        },
-        
-        "Conflicts with Black": {
-            "problem": "isort and Black disagree on formatting",
-            "solution": "Use isort profile 'black'"
-        },
-        
-        "Skip certain files": {
-            "problem": "Need to ignore specific files",
-            "solution": "Use skip or extend-skip in config"
-        },
-        
-        "Long import lines": {
-            "problem": "Imports exceed line length",
-            "solution": "Adjust multi_line_output and line_length"
-        },
-        
-        "Import order changes unexpectedly": {
-            "problem": "isort reorganizes imports differently",
-            "solution": "Check and configure sections order"
-        }
+    "Skip certain files": {
+        "problem": "Need to ignore specific files",
+        "solution": "Use skip or extend-skip in config"
+    },
+    
+    "Long import lines": {
+        "problem": "Imports exceed line length",
+        "solution": "Adjust multi_line_output and line_length"
+    },
+    
+    "Import order changes unexpectedly": {
+        "problem": "isort reorganizes imports differently",
+        "solution": "Check and configure sections order"
     }
+}
+
+
+def troubleshooting():
+    """Common isort issues and solutions"""
     
-    print("\nTroubleshooting:")
-    for issue, details in issues.items():
-        print(f"\n{issue}:")
-        print(f"  Problem: {details['problem']}")
-        print(f"  Solution: {details['solution']}")
+    lines = ["\nTroubleshooting:"]
+    for issue, details in _TROUBLESHOOTING.items():
+        lines.extend((f"\n{issue}:",
+                      f"  Problem: {details['problem']}",
+                      f"  Solution: {details['solution']}"))
+    print("\n".join(lines))
 
 
 def before_after_example():
@@ -462,6 +509,18 @@ from . import local_utils
     print(after.strip())
 
 
+def demonstrate_isort_on_example():
+    """Run isort as a library on the full disorganized import block"""
+    try:
+        import isort
+    except ImportError:
+        print("\nInstall isort to see the full example sorted: pip install isort")
+        return
+    
+    print("\nFull example sorted by isort (black profile):")
+    print(isort.code(_DISORGANIZED_EXAMPLE, profile="black").strip())
+
+
 # Some example usage of the imports to avoid unused import warnings
 def example_usage():
     """Example function using some of the imports"""
@@ -490,10 +549,17 @@ def example_usage():
     }
 
 
+_SEP = "=" * 60
+_BANNER = f"{_SEP}\nStep 5: isort - Import Organization\n{_SEP}"
+_FOOTER = (f"\n{_SEP}\n"
+           "Try these commands:\n"
+           "  isort --diff examples/step5_isort_imports.py\n"
+           "  isort --profile black examples/step5_isort_imports.py\n"
+           f"{_SEP}")
+
+
 if __name__ == "__main__":
-    print("=" * 60)
-    print("Step 5: isort - Import Organization")
-    print("=" * 60)
+    print(_BANNER)
     
     print("\n📚 Import Organization:")
     demonstrate_import_organization()
@@ -522,13 +588,12 @@ if __name__ == "__main__":
     print("\n📋 Before/After:")
     before_after_example()
     
+    print("\n🧹 Sorting the Full Example:")
+    demonstrate_isort_on_example()
+    
     # Show example usage
     print("\n🧪 Testing imports:")
     result = example_usage()
     print(f"Example result: {result['time'][:19]}")
     
-    print("\n" + "=" * 60)
-    print("Try these commands:")
-    print("  isort --diff examples/step5_isort_imports.py")
-    print("  isort --profile black examples/step5_isort_imports.py")
-    print("=" * 60)
\ No newline at end of file
+    print(_FOOTER)
\ No newline at end of file
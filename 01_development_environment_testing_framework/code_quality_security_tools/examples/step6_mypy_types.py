@@ -2,15 +2,32 @@
 Step 6: mypy - Type Checking
 Learn how mypy helps catch type errors and improve code reliability
 
-Run: mypy examples/step6_mypy_types.py
-Run: mypy --strict examples/step6_mypy_types.py
+Run: dmypy run -- examples/step6_mypy_types.py
+Run: dmypy run -- --strict examples/step6_mypy_types.py
+(plain mypy works too, but re-reads typeshed on every run)
 """
 
-from typing import List, Dict, Optional, Union, Any, Callable, TypeVar, Generic
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import TypeVar, Generic
 from typing import Protocol, Literal, Final, ClassVar
 from abc import ABC, abstractmethod
+from functools import singledispatch
 import json
 
+# The ignores keep the optional imports out of the lesson's mypy output,
+# whether or not numpy/numba are installed
+try:
+    import numpy as np  # type: ignore[import-not-found, unused-ignore]  # Optional: vectorized fast paths
+except ImportError:
+    np = None  # type: ignore[assignment, unused-ignore]
+
+try:
+    from numba import njit  # type: ignore[import-not-found, unused-ignore]  # Optional: JIT-compiled batch kernels
+except ImportError:
+    njit = None  # type: ignore[assignment, unused-ignore]
+
 
 # GOOD: Proper type annotations
 def calculate_area(length: float, width: float) -> float:
@@ -23,8 +40,53 @@ def calculate_volume(length, width, height):
     return length * width * height
 
 
+# Compiled batch kernels: numba fuses each expression into one loop with
+# no temporaries and spreads it across cores (parallel=True)
+if njit is not None and np is not None:
+    @njit("float64[:](float64[:], float64[:])", parallel=True, cache=True)
+    def _area_array(lengths, widths):  # type: ignore[no-untyped-def]
+        return lengths * widths
+
+    @njit("float64[:](float64[:], float64[:], float64[:])", parallel=True, cache=True)
+    def _volume_array(lengths, widths, heights):  # type: ignore[no-untyped-def]
+        return lengths * widths * heights
+else:
+    _area_array = None
+    _volume_array = None
+
+
+# GOOD: Vectorized variants for batches of shapes
+def calculate_area_array(lengths: "np.ndarray | list[float]",
+                         widths: "np.ndarray | list[float]") -> "np.ndarray | list[float]":
+    """Calculate many areas at once; compiled with numba when available"""
+    if np is None:
+        return [float(length * width) for length, width in zip(lengths, widths)]
+    lengths = np.asarray(lengths, dtype=np.float64)
+    widths = np.asarray(widths, dtype=np.float64)
+    if _area_array is not None:
+        areas: np.ndarray = _area_array(lengths, widths)
+        return areas
+    return lengths * widths
+
+
+def calculate_volume_array(lengths: "np.ndarray | list[float]",
+                           widths: "np.ndarray | list[float]",
+                           heights: "np.ndarray | list[float]") -> "np.ndarray | list[float]":
+    """Calculate many volumes at once; compiled with numba when available"""
+    if np is None:
+        return [float(length * width * height)
+                for length, width, height in zip(lengths, widths, heights)]
+    lengths = np.asarray(lengths, dtype=np.float64)
+    widths = np.asarray(widths, dtype=np.float64)
+    heights = np.asarray(heights, dtype=np.float64)
+    if _volume_array is not None:
+        volumes: np.ndarray = _volume_array(lengths, widths, heights)
+        return volumes
+    return lengths * widths * heights
+
+
 # GOOD: Function with optional parameter
-def greet_user(name: str, title: Optional[str] = None) -> str:
+def greet_user(name: str, title: str | None = None) -> str:
     """Greet user with optional title"""
     if title:
         return f"Hello, {title} {name}!"
@@ -38,20 +100,28 @@ def get_user_count() -> str:
 
 
 # GOOD: Proper list typing
-def process_numbers(numbers: List[int]) -> List[int]:
+def process_numbers(numbers: list[int]) -> list[int]:
     """Process a list of integers"""
     return [n * 2 for n in numbers]
 
 
+# GOOD: Vectorized variant for large inputs
+def process_numbers_array(numbers: "np.ndarray | list[int]") -> "np.ndarray | list[int]":
+    """Double every element with one NumPy shift (SIMD) instead of a Python loop"""
+    if np is None:
+        return [n << 1 for n in numbers]
+    return np.asarray(numbers, dtype=np.int64) << 1
+
+
 # BAD: Using wrong types
-def bad_list_processing(numbers: List[str]) -> List[int]:
+def bad_list_processing(numbers: list[str]) -> list[int]:
     """This has type mismatches"""
-    # Type error: List[str] items don't have mathematical operations
+    # Type error: list[str] items don't have mathematical operations
     return [n * 2 for n in numbers]  # str * int gives str, not int
 
 
 # GOOD: Dictionary typing
-def get_user_info(user_id: int) -> Dict[str, Union[str, int]]:
+def get_user_info(user_id: int) -> dict[str, str | int]:
     """Get user information with proper typing"""
     return {
         "name": "John Doe",
@@ -61,14 +131,14 @@ def get_user_info(user_id: int) -> Dict[str, Union[str, int]]:
 
 
 # BAD: Accessing possibly None value
-def unsafe_none_handling(user_data: Optional[Dict[str, str]]) -> str:
+def unsafe_none_handling(user_data: dict[str, str] | None) -> str:
     """Unsafe handling of Optional type"""
     # Type error: user_data might be None
     return user_data["name"]  # Potential AttributeError
 
 
 # GOOD: Safe None handling
-def safe_none_handling(user_data: Optional[Dict[str, str]]) -> str:
+def safe_none_handling(user_data: dict[str, str] | None) -> str:
     """Safe handling of Optional type"""
     if user_data is None:
         return "Unknown"
@@ -94,19 +164,27 @@ def consistent_return(success: bool) -> str:
 
 
 # Demonstrate Union types
-def process_id(user_id: Union[int, str]) -> str:
+# singledispatch picks the implementation from type(user_id) with a dict
+# lookup, so supporting another ID type is one more register() call
+@singledispatch
+def process_id(user_id: int | str) -> str:
     """Process user ID that can be int or str"""
-    if isinstance(user_id, int):
-        return f"User #{user_id}"
     return f"User {user_id}"
 
 
+@process_id.register
+def _(user_id: int) -> str:
+    return f"User #{user_id}"
+
+
 # Demonstrate Generic types
 T = TypeVar('T')
 
 class Container(Generic[T]):
     """Generic container class"""
     
+    __slots__ = ('_value',)  # No per-instance __dict__
+    
     def __init__(self, value: T) -> None:
         self._value = value
     
@@ -128,6 +206,8 @@ class Drawable(Protocol):
 class Circle:
     """Circle class implementing Drawable protocol"""
     
+    __slots__ = ('radius',)
+    
     def __init__(self, radius: float) -> None:
         self.radius = radius
     
@@ -138,6 +218,8 @@ class Circle:
 class Rectangle:
     """Rectangle class implementing Drawable protocol"""
     
+    __slots__ = ('width', 'height')
+    
     def __init__(self, width: float, height: float) -> None:
         self.width = width
         self.height = height
@@ -151,6 +233,15 @@ def render_shape(shape: Drawable) -> str:
     return shape.draw()
 
 
+def draw_all(radii: Iterable[float], sizes: Iterable[tuple[float, float]]) -> list[str]:
+    """Render many circles and rectangles given as columns of sizes"""
+    # Structure-of-arrays batch path: no object or draw() call per shape;
+    # works the same on lists or NumPy arrays
+    lines = [f"Drawing circle with radius {radius}" for radius in radii]
+    lines.extend(f"Drawing rectangle {width}x{height}" for width, height in sizes)
+    return lines
+
+
 # BAD: Class not implementing protocol
 class Triangle:
     """Triangle class NOT implementing Drawable protocol"""
@@ -174,6 +265,7 @@ class Configuration:
     
     API_VERSION: Final[str] = "v1.0"  # Cannot be changed
     instance_count: ClassVar[int] = 0  # Class variable
+    __slots__ = ('name',)  # Class attributes above stay on the class
     
     def __init__(self, name: str) -> None:
         self.name = name
@@ -181,8 +273,14 @@ class Configuration:
 
 
 # Demonstrate callable types
-def apply_operation(numbers: List[int], operation: Callable[[int], int]) -> List[int]:
+def apply_operation(numbers: list[int], operation: Callable[[int], int]) -> list[int]:
     """Apply operation to each number"""
+    if (operation is square and _square_array is not None and numbers
+            and -_INT64_SQUARE_MAX <= min(numbers) and max(numbers) <= _INT64_SQUARE_MAX):
+        # One compiled loop instead of a Python call per element; only
+        # taken when every square fits in int64, so it never wraps
+        squares: list[int] = _square_array(np.asarray(numbers, dtype=np.int64)).tolist()
+        return squares
     return [operation(n) for n in numbers]
 
 
@@ -190,6 +288,20 @@ def square(x: int) -> int:
     return x * x
 
 
+# Largest |n| whose square fits in int64: isqrt(2**63 - 1)
+_INT64_SQUARE_MAX: Final = 3_037_000_499
+
+if njit is not None and np is not None:
+    @njit("int64[:](int64[:])", cache=True)
+    def _square_array(a):  # type: ignore[no-untyped-def]
+        out = np.empty_like(a)
+        for i in range(a.shape[0]):
+            out[i] = a[i] * a[i]
+        return out
+else:
+    _square_array = None
+
+
 # BAD: Calling method that doesn't exist
 def method_error_demo() -> None:
     """Demonstrate method error"""
@@ -235,32 +347,30 @@ class Fish(Animal):
     # Missing make_sound() implementation
 
 
+_FEATURES: Final[dict[str, str]] = {
+    "Static Type Checking": "Catch type errors before runtime",
+    "Gradual Typing": "Add types incrementally to existing code",
+    "Type Inference": "Infer types when not explicitly annotated",
+    "Generic Support": "Support for generic types and type variables",
+    "Protocol Support": "Structural typing with protocols",
+    "Union Types": "Handle multiple possible types",
+    "Optional Types": "Explicit handling of None values",
+    "Literal Types": "Restrict values to specific literals",
+    "Final Types": "Prevent reassignment of variables",
+    "Abstract Base Classes": "Enforce interface contracts"
+}
+
+
 def demonstrate_mypy_features():
     """Show key mypy features"""
     
-    features = {
-        "Static Type Checking": "Catch type errors before runtime",
-        "Gradual Typing": "Add types incrementally to existing code",
-        "Type Inference": "Infer types when not explicitly annotated",
-        "Generic Support": "Support for generic types and type variables",
-        "Protocol Support": "Structural typing with protocols",
-        "Union Types": "Handle multiple possible types",
-        "Optional Types": "Explicit handling of None values",
-        "Literal Types": "Restrict values to specific literals",
-        "Final Types": "Prevent reassignment of variables",
-        "Abstract Base Classes": "Enforce interface contracts"
-    }
-    
-    print("MyPy Key Features:")
-    for feature, description in features.items():
-        print(f"  • {feature}: {description}")
+    lines = ["MyPy Key Features:"]
+    lines.extend(f"  • {feature}: {description}" for feature, description in _FEATURES.items())
+    print("\n".join(lines))
 
 
-def mypy_configuration():
-    """Show mypy configuration options"""
-    
-    config_examples = {
-        "mypy.ini": """
+_CONFIG_EXAMPLES: Final[dict[str, str]] = {
+    "mypy.ini": """
 [mypy]
 python_version = 3.8
 warn_return_any = True
@@ -275,6 +385,12 @@ warn_unused_ignores = True
 warn_no_return = True
 warn_unreachable = True
 strict_equality = True
+# Required by the mypy daemon (dmypy)
+local_partial_types = True
+# Reuse per-module results from earlier runs
+incremental = True
+cache_dir = .mypy_cache
+sqlite_cache = True
 
 # Per-module options
 [mypy-requests.*]
@@ -283,8 +399,8 @@ ignore_missing_imports = True
 [mypy-numpy.*]
 ignore_missing_imports = True
 """,
-        
-        "pyproject.toml": """
+    
+    "pyproject.toml": """
 [tool.mypy]
 python_version = "3.8"
 warn_return_any = true
@@ -299,13 +415,19 @@ warn_unused_ignores = true
 warn_no_return = true
 warn_unreachable = true
 strict_equality = true
+# Required by the mypy daemon (dmypy)
+local_partial_types = true
+# Reuse per-module results from earlier runs
+incremental = true
+cache_dir = ".mypy_cache"
+sqlite_cache = true
 
 [[tool.mypy.overrides]]
 module = ["requests.*", "numpy.*"]
 ignore_missing_imports = true
 """,
-        
-        "Command Line": """
+    
+    "Command Line": """
 # Basic type checking
 mypy file.py
 
@@ -326,63 +448,76 @@ mypy --html-report mypy-report/ mypackage/
 
 # Install missing stub packages
 mypy --install-types file.py
+
+# Daemon mode: keeps state in memory between runs
+dmypy run -- file.py
+dmypy stop
+
+# Write a fine-grained cache so a fresh daemon starts warm
+# (occasionally reported to hang on large codebases; drop it if so)
+mypy --cache-fine-grained file.py
+dmypy run -- --use-fine-grained-cache file.py
 """
-    }
+}
+
+
+def mypy_configuration():
+    """Show mypy configuration options"""
     
-    print("\nMyPy Configuration:")
-    for name, config in config_examples.items():
-        print(f"\n{name}:")
-        print(config)
+    lines = ["\nMyPy Configuration:"]
+    lines.extend(f"\n{name}:\n{config}" for name, config in _CONFIG_EXAMPLES.items())
+    print("\n".join(lines))
+
+
+_COMMON_ERRORS: Final[dict[str, dict[str, str]]] = {
+    "error: Function is missing a return type annotation": {
+        "bad": "def get_data():",
+        "good": "def get_data() -> Dict[str, Any]:",
+        "code": "return_value"
+    },
+    
+    "error: Argument has incompatible type": {
+        "bad": 'add_numbers("5", "10")  # strings to int function',
+        "good": "add_numbers(5, 10)  # correct types",
+        "code": "arg_type"
+    },
+    
+    "error: Item has no attribute": {
+        "bad": 'text: str = "hello"\ntext.append("world")',
+        "good": 'text: str = "hello"\ntext += "world"',
+        "code": "attr_defined"
+    },
+    
+    "error: Incompatible return value type": {
+        "bad": "def get_name() -> str:\n    return 42",
+        "good": "def get_name() -> str:\n    return 'John'",
+        "code": "return_type"
+    },
+    
+    "error: Argument of type 'None' cannot be assigned": {
+        "bad": "def process(data: Optional[str]) -> str:\n    return data.upper()",
+        "good": "def process(data: Optional[str]) -> str:\n    return data.upper() if data else ''",
+        "code": "assignment"
+    }
+}
 
 
 def common_type_errors():
     """Show common mypy error patterns and fixes"""
     
-    errors = {
-        "error: Function is missing a return type annotation": {
-            "bad": "def get_data():",
-            "good": "def get_data() -> Dict[str, Any]:",
-            "code": "return_value"
-        },
-        
-        "error: Argument has incompatible type": {
-            "bad": 'add_numbers("5", "10")  # strings to int function',
-            "good": "add_numbers(5, 10)  # correct types",
-            "code": "arg_type"
-        },
-        
-        "error: Item has no attribute": {
-            "bad": 'text: str = "hello"\ntext.append("world")',
-            "good": 'text: str = "hello"\ntext += "world"',
-            "code": "attr_defined"
-        },
-        
-        "error: Incompatible return value type": {
-            "bad": "def get_name() -> str:\n    return 42",
-            "good": "def get_name() -> str:\n    return 'John'",
-            "code": "return_type"
-        },
-        
-        "error: Argument of type 'None' cannot be assigned": {
-            "bad": "def process(data: Optional[str]) -> str:\n    return data.upper()",
-            "good": "def process(data: Optional[str]) -> str:\n    return data.upper() if data else ''",
-            "code": "assignment"
-        }
-    }
-    
-    print("\nCommon Type Errors and Fixes:")
-    for error, details in errors.items():
-        print(f"\n{error}:")
-        print(f"  ❌ Bad:  {details['bad']}")
-        print(f"  ✅ Good: {details['good']}")
-        print(f"  Code: {details['code']}")
+    lines = ["\nCommon Type Errors and Fixes:"]
+    for error, details in _COMMON_ERRORS.items():
+        lines.extend((
+            f"\n{error}:",
+            f"  ❌ Bad:  {details['bad']}",
+            f"  ✅ Good: {details['good']}",
+            f"  Code: {details['code']}",
+        ))
+    print("\n".join(lines))
 
 
-def advanced_typing_patterns():
-    """Show advanced typing patterns"""
-    
-    patterns = {
-        "Type Aliases": """
+_TYPING_PATTERNS: Final[dict[str, str]] = {
+    "Type Aliases": """
 # Create readable type aliases
 UserId = int
 UserData = Dict[str, Union[str, int]]
@@ -391,8 +526,8 @@ Coordinates = tuple[float, float]
 def get_user(user_id: UserId) -> UserData:
     return {"name": "John", "age": 30}
 """,
-        
-        "Overloads": """
+    
+    "Overloads": """
 from typing import overload
 
 @overload
@@ -406,8 +541,8 @@ def process(data: Union[str, int]) -> Union[str, int]:
         return data.upper()
     return data * 2
 """,
-        
-        "TypedDict": """
+    
+    "TypedDict": """
 from typing_extensions import TypedDict
 
 class UserInfo(TypedDict):
@@ -418,27 +553,27 @@ class UserInfo(TypedDict):
 def process_user(user: UserInfo) -> str:
     return f"{user['name']} ({user['age']})"
 """,
-        
-        "Callback Protocols": """
+    
+    "Callback Protocols": """
 class Validator(Protocol):
     def __call__(self, value: str) -> bool: ...
 
 def validate_input(value: str, validator: Validator) -> bool:
     return validator(value)
 """
-    }
-    
-    print("\nAdvanced Typing Patterns:")
-    for pattern, example in patterns.items():
-        print(f"\n{pattern}:")
-        print(example.strip())
+}
 
 
-def integration_examples():
-    """Show mypy integration with development workflow"""
+def advanced_typing_patterns():
+    """Show advanced typing patterns"""
     
-    integrations = {
-        "Pre-commit hook": """
+    lines = ["\nAdvanced Typing Patterns:"]
+    lines.extend(f"\n{pattern}:\n{example.strip()}" for pattern, example in _TYPING_PATTERNS.items())
+    print("\n".join(lines))
+
+
+_INTEGRATIONS: Final[dict[str, str]] = {
+    "Pre-commit hook": """
 # .pre-commit-config.yaml
 repos:
   - repo: https://github.com/pre-commit/mirrors-mypy
@@ -447,8 +582,8 @@ repos:
       - id: mypy
         additional_dependencies: [types-requests]
 """,
-        
-        "GitHub Actions": """
+    
+    "GitHub Actions": """
 # .github/workflows/type-check.yml
 name: Type Check
 on: [push, pull_request]
@@ -466,8 +601,8 @@ jobs:
     - name: Type check
       run: mypy .
 """,
-        
-        "VS Code": """
+    
+    "VS Code": """
 {
     "python.linting.mypyEnabled": true,
     "python.linting.enabled": true,
@@ -477,51 +612,53 @@ jobs:
     ]
 }
 """,
-        
-        "tox": """
+    
+    "tox": """
 # tox.ini
 [testenv:type-check]
 deps = mypy
 commands = mypy src/
 """
-    }
+}
+
+
+def integration_examples():
+    """Show mypy integration with development workflow"""
     
-    print("\nIntegration Examples:")
-    for name, config in integrations.items():
-        print(f"\n{name}:")
-        print(config)
+    lines = ["\nIntegration Examples:"]
+    lines.extend(f"\n{name}:\n{config}" for name, config in _INTEGRATIONS.items())
+    print("\n".join(lines))
+
+
+_STUB_INFO: Final[dict[str, str]] = {
+    "What are stubs?": "Files with type information for libraries",
+    "Installation": "pip install types-requests types-redis",
+    "Typeshed": "Repository of stubs for standard library",
+    "Stub packages": "types-* packages on PyPI"
+}
+
+
+_COMMON_STUBS: Final[tuple[str, ...]] = (
+    "types-requests",
+    "types-redis", 
+    "types-PyYAML",
+    "types-python-dateutil",
+    "types-beautifulsoup4",
+    "types-Pillow",
+    "types-setuptools"
+)
 
 
 def type_stubs_and_third_party():
     """Information about type stubs and third-party packages"""
     
-    stub_info = {
-        "What are stubs?": "Files with type information for libraries",
-        "Installation": "pip install types-requests types-redis",
-        "Typeshed": "Repository of stubs for standard library",
-        "Stub packages": "types-* packages on PyPI"
-    }
-    
-    common_stubs = [
-        "types-requests",
-        "types-redis", 
-        "types-PyYAML",
-        "types-python-dateutil",
-        "types-beautifulsoup4",
-        "types-Pillow",
-        "types-setuptools"
-    ]
-    
-    print("\nType Stubs Information:")
-    for concept, description in stub_info.items():
-        print(f"  {concept}: {description}")
-    
-    print("\nCommon Stub Packages:")
-    for stub in common_stubs:
-        print(f"  {stub}")
-    
-    print("\nInstall stubs automatically:")
-    print("  mypy --install-types file.py")
+    lines = ["\nType Stubs Information:"]
+    lines.extend(f"  {concept}: {description}" for concept, description in _STUB_INFO.items())
+    lines.append("\nCommon Stub Packages:")
+    lines.extend(f"  {stub}" for stub in _COMMON_STUBS)
+    lines.append("\nInstall stubs automatically:")
+    lines.append("  mypy --install-types file.py")
+    print("\n".join(lines))
 
 
 def demo_function_calls():
@@ -542,7 +679,7 @@ def demo_function_calls():
         circle = Circle(5.0)
         rectangle = Rectangle(10.0, 3.0)
         
-        shapes: List[Drawable] = [circle, rectangle]
+        shapes: list[Drawable] = [circle, rectangle]
         for shape in shapes:
             print(render_shape(shape))
         
@@ -553,7 +690,7 @@ def demo_function_calls():
         dog = Dog("Buddy")
         cat = Cat("Whiskers")
         
-        animals: List[Animal] = [dog, cat]
+        animals: list[Animal] = [dog, cat]
         for animal in animals:
             print(f"{animal.name}: {animal.make_sound()}")
         
@@ -563,10 +700,19 @@ def demo_function_calls():
         print(f"Error in demo: {e}")
 
 
+_SEP = "=" * 60
+_BANNER = f"{_SEP}\nStep 6: mypy - Type Checking\n{_SEP}"
+_FOOTER = (f"\n{_SEP}\n"
+           "Try these commands:\n"
+           "  dmypy run -- examples/step6_mypy_types.py\n"
+           "  dmypy run -- --strict examples/step6_mypy_types.py\n"
+           "  dmypy run -- --show-error-codes examples/step6_mypy_types.py\n"
+           "  python run_typecheck.py  # dmypy locally, plain mypy in CI\n"
+           f"{_SEP}")
+
+
 if __name__ == "__main__":
-    print("=" * 60)
-    print("Step 6: mypy - Type Checking")
-    print("=" * 60)
+    print(_BANNER)
     
     print("\n🎯 MyPy Features:")
     demonstrate_mypy_features()
@@ -589,9 +735,4 @@ if __name__ == "__main__":
     print("\n🧪 Demo:")
     demo_function_calls()
     
-    print("\n" + "=" * 60)
-    print("Try these commands:")
-    print("  mypy examples/step6_mypy_types.py")
-    print("  mypy --strict examples/step6_mypy_types.py")
-    print("  mypy --show-error-codes examples/step6_mypy_types.py")
-    print("=" * 60)
\ No newline at end of file
+    print(_FOOTER)
\ No newline at end of file
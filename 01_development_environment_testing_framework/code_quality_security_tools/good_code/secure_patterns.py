@@ -4,30 +4,53 @@ This file demonstrates secure coding practices that avoid common vulnerabilities
 """
 
 import hashlib
+import json
 import secrets
 import sqlite3
 import subprocess
 import tempfile
+import threading
 import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Union
 from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import base64
 import ssl
 import pickle
 import logging
 
+try:
+    from argon2 import PasswordHasher
+    from argon2.exceptions import VerifyMismatchError
+except ImportError:  # argon2-cffi is optional; only the password helpers need it
+    PasswordHasher = None
+
+try:
+    import orjson  # Optional: much faster JSON encode/decode
+except ImportError:
+    orjson = None
+
+_DB_PATH = 'database.db'
+_db_local = threading.local()
+
+def _get_connection() -> sqlite3.Connection:
+    """Per-thread connection, opened on first use and reused afterwards"""
+    conn = getattr(_db_local, 'conn', None)
+    if conn is None:
+        # The journal mode is a property of the database file, so it is left
+        # to whoever creates the database
+        conn = sqlite3.connect(_DB_PATH, isolation_level=None)
+        _db_local.conn = conn
+    return conn
+
 # GOOD: Use parameterized queries to prevent SQL injection
 def get_user_data_secure(user_id: int):
     """Secure database query using parameterized statements"""
-    conn = sqlite3.connect('database.db')
-    cursor = conn.cursor()
-    # Use parameterized queries to prevent SQL injection
-    cursor.execute("SELECT * FROM users WHERE id = ?", (user_id,))
-    result = cursor.fetchall()
-    conn.close()
-    return result
+    conn = _get_connection()
+    # Use parameterized queries to prevent SQL injection; the connection
+    # also caches the prepared statement across calls
+    return conn.execute("SELECT * FROM users WHERE id = ?", (user_id,)).fetchall()
 
 # GOOD: Environment variables for sensitive data
 def get_database_credentials():
@@ -61,12 +84,10 @@ def run_command_secure(cmd_args: list):
 # GOOD: Secure temporary file creation
 def create_secure_temp_file():
     """Create temporary file with secure permissions"""
-    # Use secure file creation
+    # Use secure file creation; mkstemp creates with 0600 already
+    # (owner only), so no separate chmod is needed
     fd, path = tempfile.mkstemp()
     try:
-        # Set restrictive permissions (owner only)
-        os.chmod(path, 0o600)
-        
         # Work with the file
         with os.fdopen(fd, 'w') as temp_file:
             temp_file.write("Secure temporary data")
@@ -105,25 +126,43 @@ def derive_key_from_password(password: bytes, salt: bytes = None) -> bytes:
     if salt is None:
         salt = os.urandom(16)
     
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,
-        salt=salt,
-        iterations=100000,  # High iteration count
-    )
-    key = base64.urlsafe_b64encode(kdf.derive(password))
+    # hashlib runs the whole iteration loop inside OpenSSL
+    raw = hashlib.pbkdf2_hmac('sha256', password, salt,
+                              100000,  # High iteration count
+                              dklen=32)
+    key = base64.urlsafe_b64encode(raw)
     return key
 
 # GOOD: Secure data serialization
+# Bound once at import: orjson when installed, stdlib json otherwise.
+# Both produce the same compact, UTF-8 output and accept non-str dict
+# keys. orjson's errors subclass TypeError and json.JSONDecodeError, so
+# the handlers below catch both.
+def _json_dumps(data) -> str:
+    return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+if orjson is not None:
+    def _dumps(data) -> str:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            # e.g. ints wider than 64 bits, which only json can encode;
+            # data json can't encode either still raises TypeError
+            return _json_dumps(data)
+
+    _loads = orjson.loads
+else:
+    _dumps = _json_dumps
+    _loads = json.loads
+
 class SecureDataHandler:
     """Secure data serialization without pickle vulnerabilities"""
     
     @staticmethod
     def serialize_data(data):
         """Use JSON instead of pickle for untrusted data"""
-        import json
         try:
-            return json.dumps(data)
+            return _dumps(data)
         except TypeError as e:
             logging.error(f"Data not JSON serializable: {e}")
             raise
@@ -131,9 +170,8 @@ class SecureDataHandler:
     @staticmethod
     def deserialize_data(data: str):
         """Safe deserialization using JSON"""
-        import json
         try:
-            return json.loads(data)
+            return _loads(data)
         except json.JSONDecodeError as e:
             logging.error(f"Invalid JSON data: {e}")
             raise
@@ -180,7 +218,19 @@ def generate_secure_token(length: int = 32) -> str:
 
 def generate_secure_number(min_val: int = 1000, max_val: int = 9999) -> int:
     """Generate cryptographically secure random number"""
-    return secrets.randbelow(max_val - min_val + 1) + min_val
+    span = max_val - min_val + 1
+    if span <= 0:
+        raise ValueError("max_val must not be less than min_val")
+    # Rejection sampling: draw just enough random bits to cover span and
+    # retry when the draw lands outside it, so every value is equally
+    # likely (plain modulo would favour the low values). span is more
+    # than half the mask, so this loops fewer than twice on average.
+    mask = (1 << span.bit_length()) - 1
+    nbytes = (span.bit_length() + 7) // 8
+    while True:
+        r = int.from_bytes(os.urandom(nbytes), 'little') & mask
+        if r < span:
+            return min_val + r
 
 # GOOD: Secure input handling
 def get_user_input_secure(prompt: str, allowed_chars: str = None) -> str:
@@ -194,12 +244,18 @@ def get_user_input_secure(prompt: str, allowed_chars: str = None) -> str:
     if len(user_input) > 1000:  # Prevent very long inputs
         raise ValueError("Input too long")
     
-    if allowed_chars and not all(c in allowed_chars for c in user_input):
+    # A set gives one hash lookup per character instead of a substring
+    # search of allowed_chars, and issuperset runs the loop in C
+    if allowed_chars and not frozenset(allowed_chars).issuperset(user_input):
         raise ValueError("Input contains invalid characters")
     
     return user_input
 
 # GOOD: Secure SSL/TLS configuration
+# Built once: loading the CA bundle and parsing the cipher string is the
+# expensive part, and a client-side context is safe to share between
+# threads. Callers must not modify the returned context.
+@lru_cache(maxsize=1)
 def create_secure_ssl_context():
     """Create secure SSL context with proper verification"""
     context = ssl.create_default_context()
@@ -219,21 +275,22 @@ def create_secure_ssl_context():
     return context
 
 # GOOD: Secure password hashing
+# One shared hasher, created on first use; its defaults are the RFC 9106
+# low-memory profile
+@lru_cache(maxsize=1)
+def _password_hasher():
+    if PasswordHasher is None:
+        raise ImportError("argon2-cffi is required: pip install argon2-cffi")
+    return PasswordHasher()
+
 def hash_password_secure(password: str) -> str:
     """Secure password hashing using modern algorithms"""
-    from argon2 import PasswordHasher
-    
-    ph = PasswordHasher()
-    return ph.hash(password)
+    return _password_hasher().hash(password)
 
 def verify_password_secure(hashed_password: str, password: str) -> bool:
     """Verify password against secure hash"""
-    from argon2 import PasswordHasher
-    from argon2.exceptions import VerifyMismatchError
-    
-    ph = PasswordHasher()
     try:
-        ph.verify(hashed_password, password)
+        _password_hasher().verify(hashed_password, password)
         return True
     except VerifyMismatchError:
         return False
@@ -241,8 +298,6 @@ def verify_password_secure(hashed_password: str, password: str) -> bool:
 # GOOD: Secure file permissions
 def create_secure_config_file(config_data: dict, file_path: str):
     """Create configuration file with secure permissions"""
-    import json
-    
     # Create file with restrictive permissions
     flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL  # Fail if exists
     fd = os.open(file_path, flags, 0o600)  # Owner read/write only
@@ -259,15 +314,25 @@ def create_secure_config_file(config_data: dict, file_path: str):
         raise
 
 # GOOD: Logging sensitive information safely
-def log_user_action(user_id: int, action: str, sensitive_data: str = None):
+# A log tag only needs to correlate entries, not resist collisions, so a
+# short BLAKE2b digest is enough and cheaper than SHA-256
+_log_tag_hash = hashlib.blake2b
+_logger = logging.getLogger(__name__)
+
+def log_user_action(user_id: int, action: str, sensitive_data: Union[str, bytes] = None):
     """Log user actions without exposing sensitive data"""
+    # Skip the hashing entirely when INFO records would be dropped anyway
+    if not _logger.isEnabledFor(logging.INFO):
+        return
     # Never log sensitive data directly
     if sensitive_data:
         # Log only hash or sanitized version
-        data_hash = hashlib.sha256(sensitive_data.encode()).hexdigest()
-        logging.info(f"User {user_id} performed {action} (data hash: {data_hash[:8]}...)")
+        if isinstance(sensitive_data, str):
+            sensitive_data = sensitive_data.encode()
+        data_hash = _log_tag_hash(sensitive_data, digest_size=8).hexdigest()
+        _logger.info(f"User {user_id} performed {action} (data hash: {data_hash})")
     else:
-        logging.info(f"User {user_id} performed {action}")
+        _logger.info(f"User {user_id} performed {action}")
 
 if __name__ == "__main__":
     print("This file demonstrates secure coding practices!")
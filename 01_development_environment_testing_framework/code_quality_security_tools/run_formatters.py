@@ -0,0 +1,346 @@
+"""
+Formatter Driver: run isort and black over many files in parallel
+Every file is an independent job, so files are spread over a process
+pool instead of being formatted one after another. Each worker imports
+isort and black once and formats in-process. Files already known
+to be formatted are skipped using an on-disk content-hash cache.
+With --quick, black only runs on files a byte scan flags as suspicious.
+With --changed, only files modified since the last commit are checked.
+
+Run: python run_formatters.py [examples/] [--fix] [--no-cache] [--quick] [--changed]
+"""
+
+import ast
+import hashlib
+import json
+import mmap
+import os
+import subprocess
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# isort runs first so black has the final say on layout
+FORMATTERS = ("isort", "black")
+
+# Byte patterns black always rewrites: tabs, padded brackets, space before
+# a comma, semicolons, backslash continuations and trailing whitespace.
+# A single quote is left out: it occurs in nearly every file (apostrophes,
+# nested quotes), so it would make --quick skip almost nothing
+_SUSPICIOUS_PATTERNS = (
+    b"\t",
+    b"( ",
+    b" )",
+    b"[ ",
+    b" ]",
+    b" ,",
+    b";",
+    b"\\\n",
+    b" \n",
+)
+
+
+def discover_files(root: str) -> List[Path]:
+    """Collect *.py files under root"""
+    path = Path(root)
+    if path.is_file():
+        return [path]
+    return sorted(path.rglob("*.py"))
+
+
+def changed_files(root: str) -> List[Path]:
+    """
+    Collect *.py files under root that differ from HEAD (staged or not)
+    Falls back to every file under root outside a git checkout.
+    """
+    path = Path(root)
+    if path.is_file():
+        return [path]
+    try:
+        result = subprocess.run(
+            ["git", "diff", "--name-only", "--relative", "--diff-filter=ACMR", "HEAD", "--", "."],
+            cwd=path, capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return discover_files(root)
+    return sorted(path / name for name in result.stdout.splitlines() if name.endswith(".py"))
+
+
+def _formatter_versions() -> str:
+    from importlib.metadata import PackageNotFoundError, version
+
+    parts = []
+    for tool in FORMATTERS:
+        try:
+            parts.append(f"{tool}-{version(tool)}")
+        except PackageNotFoundError:
+            parts.append(f"{tool}-missing")
+    return "_".join(parts)
+
+
+def _formatter_cache_file() -> Path:
+    """
+    Location of the hash cache
+    The directory is keyed by formatter versions, because a new black or
+    isort release may format the same source differently.
+    """
+    try:
+        from platformdirs import user_cache_dir
+        cache_dir = Path(user_cache_dir("sdn-tutorials"))
+    except ImportError:
+        base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+        cache_dir = Path(base) / "sdn-tutorials"
+    return cache_dir / "black-isort" / _formatter_versions() / "hashes.json"
+
+
+def _load_cache(path: Path) -> Dict[str, Any]:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_cache(path: Path, cache: Dict[str, Any]) -> None:
+    """Write the cache atomically so a killed run can't leave it truncated"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        json.dump(cache, f)
+    os.replace(tmp_path, path)
+
+
+def canonicalize(src: str) -> str:
+    """
+    Source with comments, docstrings and layout stripped
+    Two files with the same canonical form differ only cosmetically.
+    Sources that don't parse are returned unchanged.
+    """
+    try:
+        tree = ast.parse(src)
+    except SyntaxError:
+        return src
+    for node in ast.walk(tree):
+        if (isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef, ast.Module))
+                and ast.get_docstring(node, clean=False) is not None):
+            node.body = node.body[1:] or [ast.Pass()]
+    return ast.unparse(tree)
+
+
+def _canonical_hash(data: bytes) -> str:
+    src = data.decode("utf-8", errors="surrogateescape")
+    return hashlib.sha256(canonicalize(src).encode("utf-8", errors="surrogateescape")).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def _formatter_settings(directory: str) -> Tuple[Any, Any, str]:
+    """
+    isort Config, black Mode and a settings fingerprint for files in directory
+    Both tools read the project's own configuration (pyproject.toml, and
+    for isort also .isort.cfg/setup.cfg); without one, isort uses the
+    black profile and black its defaults. The fingerprint hashes the
+    config files, so editing them invalidates the hash cache.
+    """
+    import black
+    import isort
+
+    config = isort.Config(settings_path=directory)
+    config_files = {source["source"] for source in config.sources
+                    if os.path.isfile(source.get("source", ""))}
+    if not config_files:
+        config = isort.Config(profile="black")
+
+    mode = black.Mode()
+    pyproject = black.find_pyproject_toml((directory,))
+    if pyproject:
+        settings = black.parse_pyproject_toml(pyproject)
+        config_files.add(pyproject)
+        mode = black.Mode(
+            target_versions={black.TargetVersion[v.upper()]
+                             for v in settings.get("target_version", ())},
+            line_length=settings.get("line_length", black.DEFAULT_LINE_LENGTH),
+            string_normalization=not settings.get("skip_string_normalization", False),
+            magic_trailing_comma=not settings.get("skip_magic_trailing_comma", False),
+            preview=settings.get("preview", False),
+        )
+
+    digest = hashlib.sha256()
+    for config_file in sorted(config_files):
+        digest.update(config_file.encode())
+        digest.update(Path(config_file).read_bytes())
+    return config, mode, digest.hexdigest()
+
+
+def _settings_fingerprint(path: Path) -> str:
+    return _formatter_settings(str(path.resolve().parent))[2]
+
+
+def _file_signature(path: Path) -> Dict[str, Any]:
+    stat = path.stat()
+    data = path.read_bytes()
+    return {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "sha256": hashlib.sha256(data).hexdigest(),
+        "ast_sha256": _canonical_hash(data),
+        "settings": _settings_fingerprint(path),
+    }
+
+
+def is_cosmetic_change(cache: Dict[str, Any], path: Path) -> bool:
+    """
+    True if path differs from its cached version only in comments,
+    docstrings or layout
+    Such a file still goes through the formatters, since black's output
+    depends on exactly those details; the flag only tells the user that
+    no code changed.
+    """
+    entry = cache.get(str(path.resolve()))
+    return bool(entry) and entry.get("ast_sha256") == _canonical_hash(path.read_bytes())
+
+
+def is_cached(cache: Dict[str, Any], path: Path) -> bool:
+    """
+    True if path is unchanged since it was last seen formatted
+    An identical (mtime, size) pair is trusted without reading the file;
+    otherwise the content hash decides, so a touched but unedited file
+    still counts as a hit. A change to the formatter settings that apply
+    to path is always a miss.
+    """
+    entry = cache.get(str(path.resolve()))
+    if entry is None or entry.get("settings") != _settings_fingerprint(path):
+        return False
+    stat = path.stat()
+    if entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+        return True
+    if hashlib.sha256(path.read_bytes()).hexdigest() == entry["sha256"]:
+        entry["mtime_ns"] = stat.st_mtime_ns
+        entry["size"] = stat.st_size
+        return True
+    return False
+
+
+def needs_formatting(path: Path) -> bool:
+    """
+    Cheap pre-check: does the file contain a pattern black would change?
+    The file is mmapped and probed with find(), which runs at memory speed.
+    This is a heuristic: a file with no suspicious bytes can still have
+    lines that are too long, so it is only used when asked for (--quick).
+    """
+    if path.stat().st_size == 0:
+        return False
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return any(data.find(pattern) != -1 for pattern in _SUSPICIOUS_PATTERNS)
+
+
+def format_source(src: str, skip_black: bool = False, directory: str = ".") -> str:
+    """
+    Run isort and then black on source text
+    Both are used as libraries: after the first call in a process, their
+    modules, grammar tables and compiled regexes are already loaded.
+    Settings come from the project configuration found from directory.
+    """
+    import black
+    import isort
+
+    config, mode, _ = _formatter_settings(str(Path(directory).resolve()))
+    src = isort.code(src, config=config)
+    if skip_black:
+        return src
+    return black.format_str(src, mode=mode)
+
+
+def format_file(path: str, fix: bool = False, quick: bool = False) -> int:
+    """
+    Format one file in-process
+    Returns 0 if the file is (now) formatted or is skipped, 1 if check mode
+    found changes to make, and 123 if the source could not be parsed, as
+    black does. Files isort refuses, e.g. ones marked '# isort: skip_file',
+    are skipped as the isort CLI skips them.
+    """
+    import black
+    from isort.exceptions import ISortError
+
+    file = Path(path)
+    with open(file, encoding="utf-8", newline="") as f:
+        src = f.read()
+    try:
+        formatted = format_source(src, skip_black=quick and not needs_formatting(file),
+                                  directory=str(file.parent))
+    except black.InvalidInput as e:
+        print(f"error: cannot format {path}: {e}", file=sys.stderr)
+        return 123
+    except ISortError:
+        return 0
+    if formatted == src:
+        return 0
+    if not fix:
+        return 1
+    with open(file, "w", encoding="utf-8", newline="") as f:
+        f.write(formatted)
+    return 0
+
+
+def format_all(root: str, fix: bool = False, max_workers: Optional[int] = None,
+               use_cache: bool = True, quick: bool = False,
+               changed_only: bool = False) -> Dict[str, int]:
+    """
+    Format the files under root in a process pool.
+    Results are collected as they complete so failures show up early.
+    Cached files count as formatted and are never handed to a formatter.
+    A --quick run reads the cache but never adds to it: a file that skipped
+    black may still have lines that are too long.
+    """
+    files = changed_files(root) if changed_only else discover_files(root)
+    cache_file = _formatter_cache_file()
+    cache = _load_cache(cache_file) if use_cache else {}
+
+    results = {}
+    to_format = []
+    cosmetic = set()
+    for path in files:
+        if use_cache and is_cached(cache, path):
+            results[str(path)] = 0
+        else:
+            to_format.append(path)
+            if use_cache and is_cosmetic_change(cache, path):
+                cosmetic.add(path)
+
+    if to_format:
+        with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+            futures = {executor.submit(format_file, str(path), fix, quick): path for path in to_format}
+            for future in as_completed(futures):
+                path = futures[future]
+                results[str(path)] = code = future.result()
+                if code == 1:
+                    note = " (layout/comments only)" if path in cosmetic else ""
+                    print(f"{path}: would reformat{note}")
+                elif code == 0 and not quick:
+                    # Record the file as it is now, after the formatter
+                    # rewrote it, so the next run sees a hit
+                    cache[str(path.resolve())] = _file_signature(path)
+
+    if use_cache:
+        _save_cache(cache_file, cache)
+    return results
+
+
+if __name__ == "__main__":
+    argv = sys.argv[1:]
+    fix = "--fix" in argv
+    use_cache = "--no-cache" not in argv
+    quick = "--quick" in argv
+    changed_only = "--changed" in argv
+    flags = ("--fix", "--no-cache", "--quick", "--changed")
+    paths = [arg for arg in argv if arg not in flags] or ["examples"]
+
+    status = 0
+    for path in paths:
+        results = format_all(path, fix=fix, use_cache=use_cache, quick=quick,
+                             changed_only=changed_only)
+        changed = sum(1 for code in results.values() if code)
+        print(f"{path}: {len(results)} files, {changed} {'failed' if fix else 'need formatting'}")
+        status = status or int(changed > 0)
+    sys.exit(status)
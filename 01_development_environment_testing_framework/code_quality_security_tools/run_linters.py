@@ -0,0 +1,135 @@
+"""
+Linter Driver: run black, isort, flake8, bandit and mypy in one process
+Each tool is imported once and given the whole file list, instead of
+starting a fresh interpreter per file.
+
+Run: python run_linters.py [bad_code/] [--fix]
+"""
+
+import fnmatch
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Sequence
+
+SKIP_GLOBS = (
+    "*/.git",
+    "*/.venv",
+    "*/venv",
+    "*/__pycache__",
+    "*/.mypy_cache",
+    "*/reports",
+)
+
+
+def _is_skipped(path: str, skip_globs: Sequence[str]) -> bool:
+    return any(fnmatch.fnmatch(path, pattern) for pattern in skip_globs)
+
+
+def discover_files(root: str, skip_globs: Sequence[str] = SKIP_GLOBS) -> List[str]:
+    """
+    Collect *.py files under root.
+    Skip filters are applied to directories before descending into them,
+    so excluded trees are never walked at all.
+    """
+    if os.path.isfile(root):
+        return [root]
+
+    files = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = sorted(
+            d for d in dirnames
+            if not _is_skipped(os.path.join(dirpath, d), skip_globs)
+        )
+        files.extend(
+            os.path.join(dirpath, name)
+            for name in sorted(filenames)
+            if name.endswith(".py")
+        )
+    return files
+
+
+def run_black(files: List[str], fix: bool = False) -> int:
+    """Run black as a library on all files at once"""
+    import black
+
+    args = ["--quiet"] if fix else ["--check", "--diff"]
+    try:
+        return black.main([*args, *files], standalone_mode=False) or 0
+    except SystemExit as e:
+        return e.code or 0
+
+
+def run_isort(files: List[str], fix: bool = False) -> int:
+    """Run isort on each file from a thread pool sharing one interpreter"""
+    import isort
+
+    def check(path: str) -> bool:
+        if fix:
+            return isort.file(path, profile="black")
+        return isort.check_file(path, show_diff=True, profile="black")
+
+    with ThreadPoolExecutor() as executor:
+        results = list(executor.map(check, files))
+    return 0 if fix or all(results) else 1
+
+
+def run_flake8(files: List[str]) -> int:
+    """Run flake8 through its Python API"""
+    from flake8.api import legacy as flake8
+
+    report = flake8.get_style_guide().check_files(files)
+    return 1 if report.total_errors else 0
+
+
+def run_bandit(files: List[str]) -> int:
+    """Run all bandit tests over the full file list in a single pass"""
+    from bandit.core import config as bandit_config
+    from bandit.core import manager as bandit_manager
+
+    manager = bandit_manager.BanditManager(bandit_config.BanditConfig(), "file")
+    manager.discover_files(files)
+    manager.run_tests()
+    manager.output_results(
+        lines=3,
+        sev_level="LOW",
+        conf_level="LOW",
+        output_file=sys.stdout,
+        output_format="screen",
+    )
+    return 1 if manager.get_issue_list() else 0
+
+
+def run_mypy(files: List[str]) -> int:
+    """Run mypy through mypy.api"""
+    from mypy import api as mypy_api
+
+    stdout, stderr, status = mypy_api.run(["--ignore-missing-imports", *files])
+    sys.stdout.write(stdout)
+    sys.stderr.write(stderr)
+    return status
+
+
+def run_all(root: str, fix: bool = False) -> Dict[str, int]:
+    """Run every tool on the files under root and collect exit codes"""
+    files = discover_files(root)
+    return {
+        "black": run_black(files, fix=fix),
+        "isort": run_isort(files, fix=fix),
+        "flake8": run_flake8(files),
+        "bandit": run_bandit(files),
+        "mypy": run_mypy(files),
+    }
+
+
+if __name__ == "__main__":
+    argv = sys.argv[1:]
+    fix = "--fix" in argv
+    paths = [arg for arg in argv if arg != "--fix"] or ["bad_code"]
+
+    status = 0
+    for path in paths:
+        for tool, code in run_all(path, fix=fix).items():
+            print(f"{tool}: {'ok' if code == 0 else 'issues found'}")
+            status = status or code
+    sys.exit(status)
@@ -0,0 +1,43 @@
+"""
+Type Check Driver: run mypy through its daemon (dmypy)
+The daemon keeps typeshed and every checked module in memory between
+runs, so after the first check only edited files are re-analysed.
+`dmypy run` starts the daemon when none is running. In CI (CI is set)
+there is no later run to benefit, so plain mypy is used instead.
+
+Run: python run_typecheck.py [examples/step6_mypy_types.py] [--strict]
+"""
+
+import os
+import sys
+from typing import List
+
+# dmypy requires local partial types; plain mypy gets the same flag so
+# both modes report identical errors
+MYPY_FLAGS = ("--local-partial-types", "--ignore-missing-imports")
+
+
+def use_daemon() -> bool:
+    """True unless running in CI, where every run is a cold run"""
+    return not os.environ.get("CI")
+
+
+def run_typecheck(paths: List[str], strict: bool = False) -> int:
+    """Type check paths with dmypy, or with mypy.api in CI"""
+    from mypy import api as mypy_api
+
+    flags = [*MYPY_FLAGS, *(["--strict"] if strict else [])]
+    if use_daemon():
+        stdout, stderr, status = mypy_api.run_dmypy(["run", "--", *flags, *paths])
+    else:
+        stdout, stderr, status = mypy_api.run([*flags, *paths])
+    sys.stdout.write(stdout)
+    sys.stderr.write(stderr)
+    return status
+
+
+if __name__ == "__main__":
+    argv = sys.argv[1:]
+    strict = "--strict" in argv
+    paths = [arg for arg in argv if arg != "--strict"] or ["examples/step6_mypy_types.py"]
+    sys.exit(run_typecheck(paths, strict=strict))
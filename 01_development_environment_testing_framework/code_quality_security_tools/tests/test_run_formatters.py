@@ -0,0 +1,56 @@
+"""
+Tests for the formatter driver's content-hash cache
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+import run_formatters
+
+# Too long for black, but free of every byte pattern --quick looks for
+LONG_LINE_ONLY = "values = [" + ", ".join(str(i) for i in range(40)) + "]\n"
+
+
+@pytest.fixture
+def cache_file(tmp_path, monkeypatch):
+    """Point the hash cache at a temporary file"""
+    path = tmp_path / "cache" / "hashes.json"
+    monkeypatch.setattr(run_formatters, "_formatter_cache_file", lambda: path)
+    return path
+
+
+def test_quick_run_does_not_cache_unchecked_file(tmp_path, cache_file):
+    """A file --quick let through must still be checked by the next full run"""
+    source = tmp_path / "src"
+    source.mkdir()
+    module = source / "long_line.py"
+    module.write_text(LONG_LINE_ONLY)
+    assert not run_formatters.needs_formatting(module)
+
+    quick = run_formatters.format_all(str(source), quick=True, max_workers=1)
+    assert quick == {str(module): 0}
+
+    full = run_formatters.format_all(str(source), max_workers=1)
+    assert full == {str(module): 1}
+
+
+def test_isort_skip_file_is_skipped(tmp_path, cache_file):
+    """A file isort refuses is skipped instead of aborting the run"""
+    module = tmp_path / "skipped.py"
+    module.write_text("# isort: skip_file\nimport sys\nimport os\n")
+
+    assert run_formatters.format_all(str(tmp_path), max_workers=1) == {str(module): 0}
+
+
+def test_project_settings_are_used(tmp_path, cache_file):
+    """black reads line-length from the project's pyproject.toml"""
+    module = tmp_path / "long_line.py"
+    module.write_text(LONG_LINE_ONLY)
+    assert run_formatters.format_all(str(tmp_path), max_workers=1) == {str(module): 1}
+
+    (tmp_path / "pyproject.toml").write_text("[tool.black]\nline-length = 200\n")
+    run_formatters._formatter_settings.cache_clear()
+    assert run_formatters.format_all(str(tmp_path), max_workers=1) == {str(module): 0}
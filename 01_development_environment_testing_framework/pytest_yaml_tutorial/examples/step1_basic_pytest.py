@@ -7,6 +7,47 @@ Run this step: pytest examples/step1_basic_pytest.py -v
 import pytest
 
 
+# Shared test data - built once per module instead of once per test
+@pytest.fixture(scope='module')
+def config():
+    """Database-style configuration dictionary"""
+    return {
+        'host': 'localhost',
+        'port': 5432,
+        'database': 'testdb'
+    }
+
+
+@pytest.fixture(scope='module')
+def network_policy():
+    """NetworkPolicy structure similar to a Kubernetes YAML config"""
+    return {
+        'apiVersion': 'networking.k8s.io/v1',
+        'kind': 'NetworkPolicy',
+        'metadata': {
+            'name': 'test-policy',
+            'namespace': 'default'
+        },
+        'spec': {
+            'podSelector': {
+                'matchLabels': {
+                    'app': 'web'
+                }
+            }
+        }
+    }
+
+
+@pytest.fixture(scope='module')
+def expected_config():
+    """Configuration the detailed failure example compares against"""
+    return {
+        'host': 'localhost',
+        'port': 5432,
+        'ssl': True
+    }
+
+
 # Basic test function
 def test_basic_assertion():
     """Most basic test - just assert something True"""
@@ -24,73 +65,56 @@ def test_math_operations():
     assert [1, 2, 3] == [1, 2, 3]
 
 
-def test_string_operations():
+# Parametrized tests run once per case, each reported under its id
+@pytest.mark.parametrize("text, prefix, suffix, length, lower", [
+    pytest.param("Hello, World!", "Hello", "World!", 13, "hello, world!", id='greeting'),
+    pytest.param("Network Policy", "Network", "Policy", 14, "network policy", id='title'),
+])
+def test_string_operations(text, prefix, suffix, length, lower):
     """Test string manipulations"""
-    text = "Hello, World!"
-    
-    assert text.startswith("Hello")
-    assert text.endswith("World!")
-    assert len(text) == 13
-    assert text.lower() == "hello, world!"
+    assert text.startswith(prefix)
+    assert text.endswith(suffix)
+    assert len(text) == length
+    assert text.lower() == lower
 
 
-def test_list_operations():
+@pytest.mark.parametrize("numbers, member, first, last", [
+    pytest.param([1, 2, 3, 4, 5], 3, 1, 5, id='ascending'),
+    pytest.param([80, 443, 8080], 443, 80, 8080, id='ports'),
+])
+def test_list_operations(numbers, member, first, last):
     """Test list operations and membership"""
-    numbers = [1, 2, 3, 4, 5]
-    
-    assert 3 in numbers
-    assert len(numbers) == 5
-    assert numbers[0] == 1
-    assert numbers[-1] == 5
+    assert member in numbers
+    assert numbers[0] == first
+    assert numbers[-1] == last
 
 
-def test_dictionary_operations():
+def test_dictionary_operations(config):
     """Test dictionary access and validation"""
-    config = {
-        'host': 'localhost',
-        'port': 5432,
-        'database': 'testdb'
-    }
-    
     assert config['host'] == 'localhost'
     assert config['port'] == 5432
     assert 'database' in config
     assert len(config) == 3
 
 
-# Test that expects an exception
-def test_exception_handling():
+# Test that expects an exception - match= also checks the message
+@pytest.mark.parametrize("exception, match, operation", [
+    pytest.param(ZeroDivisionError, 'division by zero', lambda: 1 / 0,
+                 id='zero-division'),
+    pytest.param(KeyError, 'missing_key', lambda: {'host': 'localhost'}['missing_key'],
+                 id='missing-key'),
+    pytest.param(ValueError, 'invalid literal', lambda: int('not-a-number'),
+                 id='invalid-int'),
+])
+def test_exception_handling(exception, match, operation):
     """Test that proper exceptions are raised"""
-    with pytest.raises(ZeroDivisionError):
-        result = 1 / 0
-    
-    with pytest.raises(KeyError):
-        config = {'host': 'localhost'}
-        missing_value = config['missing_key']
-    
-    with pytest.raises(ValueError):
-        int('not-a-number')
+    with pytest.raises(exception, match=match):
+        operation()
 
 
 # Test with multiple assertions
-def test_yaml_like_structure():
+def test_yaml_like_structure(network_policy):
     """Test a structure similar to YAML/Kubernetes config"""
-    network_policy = {
-        'apiVersion': 'networking.k8s.io/v1',
-        'kind': 'NetworkPolicy',
-        'metadata': {
-            'name': 'test-policy',
-            'namespace': 'default'
-        },
-        'spec': {
-            'podSelector': {
-                'matchLabels': {
-                    'app': 'web'
-                }
-            }
-        }
-    }
-    
     # Test nested structure access
     assert network_policy['kind'] == 'NetworkPolicy'
     assert network_policy['metadata']['name'] == 'test-policy'
@@ -103,14 +127,8 @@ def test_yaml_like_structure():
 
 
 # Test that demonstrates pytest's detailed failure output
-def test_detailed_failure_example():
+def test_detailed_failure_example(expected_config):
     """This test will show pytest's detailed failure output"""
-    expected_config = {
-        'host': 'localhost',
-        'port': 5432,
-        'ssl': True
-    }
-    
     actual_config = {
         'host': 'localhost', 
         'port': 5432,
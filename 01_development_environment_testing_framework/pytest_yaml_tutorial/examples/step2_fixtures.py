@@ -4,61 +4,88 @@ Learn how to create reusable test components and manage test data
 
 Run this step: pytest examples/step2_fixtures.py -v
 """
+import copy
+import shutil
 import pytest
-import tempfile
+import yaml
 import os
+from dataclasses import dataclass
 from pathlib import Path
 
+# Safe dumper (no arbitrary Python tags), in C when LibYAML is available
+try:
+    from yaml import CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+
+
+# Immutable description of a NetworkPolicy; the fixtures below build
+# their dicts from it instead of repeating the same literal
+@dataclass(frozen=True)
+class PolicyTemplate:
+    """The fields that vary between the tutorial's NetworkPolicies"""
+    name: str
+    namespace: str = 'default'
+    app: str = 'web'
+    
+    def as_dict(self):
+        """Full NetworkPolicy manifest as a new, freely modifiable dict"""
+        return {
+            'apiVersion': 'networking.k8s.io/v1',
+            'kind': 'NetworkPolicy',
+            'metadata': {
+                'name': self.name,
+                'namespace': self.namespace
+            },
+            'spec': {
+                'podSelector': {
+                    'matchLabels': {'app': self.app}
+                },
+                'policyTypes': ['Ingress']
+            }
+        }
+
 
 # Basic fixture - returns a value
-@pytest.fixture
+# scope='session' builds it once for the whole test run; every test
+# shares the same dict, so tests must treat it as read-only
+@pytest.fixture(scope='session')
 def sample_config():
     """Fixture providing sample NetworkPolicy configuration"""
-    return {
-        'apiVersion': 'networking.k8s.io/v1',
-        'kind': 'NetworkPolicy',
-        'metadata': {
-            'name': 'sample-policy',
-            'namespace': 'test'
-        },
-        'spec': {
-            'podSelector': {
-                'matchLabels': {'app': 'web'}
-            },
-            'policyTypes': ['Ingress']
-        }
-    }
+    return PolicyTemplate('sample-policy', namespace='test').as_dict()
 
 
-# Fixture with setup and teardown
+# Function fixture for tests that modify the configuration
 @pytest.fixture
-def temp_directory():
-    """Fixture that creates and cleans up a temporary directory"""
-    # Setup: Create temporary directory
-    temp_dir = tempfile.mkdtemp()
-    
-    yield temp_dir  # Provide the directory to the test
-    
-    # Teardown: Clean up after test
-    import shutil
-    shutil.rmtree(temp_dir)
+def mutable_sample_config(sample_config):
+    """Private copy of sample_config that a test may modify"""
+    return copy.deepcopy(sample_config)
+
+
+# Session fixture - the config file is serialized once per test run
+@pytest.fixture(scope='session')
+def _policy_template(sample_config, tmp_path_factory):
+    """Template directory holding the serialized config.yaml"""
+    template_dir = tmp_path_factory.mktemp('policy_template')
+    (template_dir / 'config.yaml').write_text(yaml.dump(sample_config, Dumper=_Dumper, default_flow_style=False))
+    return template_dir
 
 
 # Fixture that depends on another fixture
+# tmp_path is built into pytest: a fresh pathlib.Path directory per test,
+# cleaned up by pytest itself (only the last 3 runs are kept)
 @pytest.fixture
-def config_file(sample_config, temp_directory):
+def config_file(_policy_template, tmp_path):
     """Fixture that creates a temporary config file"""
-    import yaml
-    
-    file_path = os.path.join(temp_directory, 'config.yaml')
-    with open(file_path, 'w') as f:
-        yaml.dump(sample_config, f)
-    
-    return file_path
+    # Copying the template is cheaper than serializing YAML for every test
+    config_dir = shutil.copytree(_policy_template, tmp_path / 'cfg')
+    return config_dir / 'config.yaml'
 
 
 # Parametrized fixture - runs test multiple times with different data
-@pytest.fixture(params=[
+# scope='module' sets each parameter up once per module; pytest groups
+# the tests that use it by parameter
+@pytest.fixture(scope='module', params=[
     'web-app',
     'api-service', 
     'database'
@@ -69,11 +96,13 @@ def app_name(request):
 
 
 # Scope fixtures - shared across multiple tests
-@pytest.fixture(scope='module')
+# Shared fixtures should be read-only: tests that depend on each other's
+# changes break when run in another order or in parallel (pytest-xdist)
+@pytest.fixture(scope='session')
 def shared_data():
-    """Module-scoped fixture - created once per test file"""
-    print("\n🔧 Setting up shared data (once per module)")
-    return {'counter': 0, 'shared_resource': 'expensive_to_create'}
+    """Session-scoped fixture - created once per test run"""
+    print("\n🔧 Setting up shared data (once per session)")
+    return {'shared_resource': 'expensive_to_create'}
 
 
 @pytest.fixture(scope='function')  # Default scope
@@ -95,48 +124,41 @@ def test_config_structure(sample_config):
 def test_config_file_creation(sample_config, config_file):
     """Test that uses both sample_config and config_file fixtures"""
     # Verify file was created
-    assert os.path.exists(config_file)
+    assert config_file.is_file()
     
     # Verify file contains our config
-    import yaml
     with open(config_file, 'r') as f:
         loaded_config = yaml.safe_load(f)
     
+    # Plain == is the fastest check: dict comparison runs in C, and on
+    # failure pytest shows exactly which keys differ
     assert loaded_config == sample_config
 
 
 # Test using parametrized fixture - runs 3 times
-def test_app_policy_generation(app_name, sample_config):
+def test_app_policy_generation(app_name, mutable_sample_config):
     """Test runs once for each app_name parameter"""
-    # Modify the sample config with the app name
-    sample_config['metadata']['name'] = f'{app_name}-policy'
-    sample_config['spec']['podSelector']['matchLabels']['app'] = app_name
+    # Modify a copy of the sample config with the app name
+    config = mutable_sample_config
+    config['metadata']['name'] = f'{app_name}-policy'
+    config['spec']['podSelector']['matchLabels']['app'] = app_name
     
-    assert sample_config['metadata']['name'].endswith('-policy')
-    assert sample_config['spec']['podSelector']['matchLabels']['app'] == app_name
+    assert config['metadata']['name'].endswith('-policy')
+    assert config['spec']['podSelector']['matchLabels']['app'] == app_name
     
     print(f"✅ Tested policy for app: {app_name}")
 
 
-# Tests demonstrating fixture scopes
-def test_shared_data_first(shared_data, fresh_data):
-    """First test using scoped fixtures"""
-    shared_data['counter'] += 1
-    fresh_data['test_name'] = 'first_test'
+# Tests demonstrating fixture scopes - each run passes on its own, in
+# any order
+@pytest.mark.parametrize('test_name', ['first_test', 'second_test'])
+def test_shared_data(shared_data, fresh_data, test_name):
+    """Test using scoped fixtures"""
+    fresh_data['test_name'] = test_name
     
-    assert shared_data['counter'] == 1
-    assert fresh_data['test_name'] == 'first_test'
-    print(f"First test: counter={shared_data['counter']}")
-
-
-def test_shared_data_second(shared_data, fresh_data):
-    """Second test using scoped fixtures"""
-    shared_data['counter'] += 1
-    fresh_data['test_name'] = 'second_test'
-    
-    assert shared_data['counter'] == 2  # Shared data persists
-    assert fresh_data['test_name'] == 'second_test'  # Fresh data is new
-    print(f"Second test: counter={shared_data['counter']}")
+    assert shared_data['shared_resource'] == 'expensive_to_create'  # Same object every run
+    assert fresh_data == {'test_id': 'unique_per_test', 'test_name': test_name}  # Fresh data is new
+    print(f"{test_name}: shared_data id={id(shared_data)}")
 
 
 # Fixture with error handling
@@ -169,8 +191,12 @@ def test_risky_resource_usage(risky_resource):
 
 # Autouse fixture - runs automatically for every test
 @pytest.fixture(autouse=True)
-def test_logger():
+def test_logger(request):
     """Fixture that automatically runs for every test"""
+    # Output is only visible with -s (--capture=no); skip it otherwise
+    if request.config.getoption('capture') != 'no':
+        yield
+        return
     print("\n📋 Auto-logging: Test is starting...")
     yield
     print("📋 Auto-logging: Test is finished!")
@@ -191,46 +217,26 @@ class TestWithFixtures:
         assert self.test_data['initialized'] is True
         assert sample_config['kind'] == 'NetworkPolicy'
     
-    def test_method_two(self, temp_directory):
+    def test_method_two(self, tmp_path):
         """Another test method in the same class"""
         assert self.test_data['initialized'] is True
-        assert os.path.exists(temp_directory)
+        assert tmp_path.is_dir()
 
 
 # Advanced fixture with factory pattern
 @pytest.fixture
-def policy_factory(temp_directory):
+def policy_factory(tmp_path):
     """Fixture that returns a factory function"""
-    created_files = []
-    
     def create_policy(name, namespace='default', app='web'):
         """Factory function to create policy configs"""
-        import yaml
+        policy = PolicyTemplate(name, namespace, app).as_dict()
         
-        policy = {
-            'apiVersion': 'networking.k8s.io/v1',
-            'kind': 'NetworkPolicy',
-            'metadata': {'name': name, 'namespace': namespace},
-            'spec': {
-                'podSelector': {'matchLabels': {'app': app}},
-                'policyTypes': ['Ingress']
-            }
-        }
-        
-        file_path = os.path.join(temp_directory, f'{name}.yaml')
-        with open(file_path, 'w') as f:
-            yaml.dump(policy, f)
-        
-        created_files.append(file_path)
+        file_path = tmp_path / f'{name}.yaml'
+        file_path.write_text(yaml.dump(policy, Dumper=_Dumper, default_flow_style=False))
         return file_path
     
-    yield create_policy  # Return the factory function
-    
-    # Cleanup all created files
-    for file_path in created_files:
-        if os.path.exists(file_path):
-            os.unlink(file_path)
-    print(f"🧹 Cleaned up {len(created_files)} policy files")
+    # No teardown needed: pytest removes tmp_path and everything in it
+    return create_policy  # Return the factory function
 
 
 def test_policy_factory_usage(policy_factory):
@@ -239,12 +245,13 @@ def test_policy_factory_usage(policy_factory):
     web_policy = policy_factory('web-policy', 'production', 'web-app')
     api_policy = policy_factory('api-policy', 'staging', 'api-service')
     
-    # Verify both files were created
-    assert os.path.exists(web_policy)
-    assert os.path.exists(api_policy)
+    # Verify both files were created - one directory listing instead of
+    # a stat() call per file
+    with os.scandir(web_policy.parent) as entries:
+        created = {entry.name for entry in entries if entry.is_file()}
+    assert {web_policy.name, api_policy.name} <= created
     
     # Verify content is different
-    import yaml
     with open(web_policy) as f:
         web_config = yaml.safe_load(f)
     with open(api_policy) as f:
@@ -256,6 +263,41 @@ def test_policy_factory_usage(policy_factory):
     assert api_config['metadata']['namespace'] == 'staging'
 
 
+# Factory fixture batching many policies into one multi-document file:
+# one open/write/close instead of one per policy
+@pytest.fixture
+def policy_bundle_factory(tmp_path):
+    """Fixture that returns a factory writing a multi-document YAML file"""
+    def create_bundle(*templates, file_name='policies.yaml'):
+        """Write one document per PolicyTemplate, separated by ---"""
+        file_path = tmp_path / file_name
+        file_path.write_text(yaml.dump_all(
+            [template.as_dict() for template in templates],
+            Dumper=_Dumper,
+            default_flow_style=False
+        ))
+        return file_path
+    
+    return create_bundle
+
+
+def test_policy_bundle_usage(policy_bundle_factory):
+    """Test writing several policies to one file and reading them back"""
+    bundle = policy_bundle_factory(
+        PolicyTemplate('web-policy', 'production', 'web-app'),
+        PolicyTemplate('api-policy', 'staging', 'api-service'),
+    )
+    
+    # One read returns every document, in the order they were written
+    with open(bundle) as f:
+        web_config, api_config = yaml.safe_load_all(f)
+    
+    assert web_config['metadata']['name'] == 'web-policy'
+    assert api_config['metadata']['name'] == 'api-policy'
+    assert web_config['metadata']['namespace'] == 'production'
+    assert api_config['metadata']['namespace'] == 'staging'
+
+
 if __name__ == "__main__":
     # Run tests when script is executed directly
     pytest.main([__file__, '-v', '-s'])  # -s shows print statements
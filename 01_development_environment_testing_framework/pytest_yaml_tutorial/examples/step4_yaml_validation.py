@@ -4,6 +4,7 @@ Learn how to validate YAML configurations with custom rules and error handling
 
 Run this step: pytest examples/step4_yaml_validation.py -v
 """
+import fastjsonschema
 import pytest
 import yaml
 import tempfile
@@ -16,45 +17,131 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from config_manager import NetworkPolicyConfigManager, ConfigValidationError
 
+# JSON Schema for the NetworkPolicy shape ConfigValidator accepts. The
+# name pattern mirrors the hand-written metadata check: re's \w is
+# str.isalnum() plus '_', so [^\W_] is exactly the isalnum() characters;
+# '.' and '-' are also allowed, but not '-' at either end
+_SCHEMA = {
+    'type': 'object',
+    'required': ['apiVersion', 'kind', 'metadata', 'spec'],
+    'properties': {
+        'apiVersion': {'enum': ['networking.k8s.io/v1', 'networking.k8s.io/v1beta1']},
+        'kind': {'enum': ['NetworkPolicy']},
+        'metadata': {
+            'type': 'object',
+            'required': ['name'],
+            'properties': {
+                'name': {'type': 'string', 'pattern': r'^(?!-)(?:[^\W_]|[.-])+(?<!-)\Z'},
+            },
+        },
+        'spec': {
+            'type': 'object',
+            'required': ['podSelector'],
+            'properties': {
+                'podSelector': {'type': 'object'},
+                'policyTypes': {'type': 'array', 'items': {'enum': ['Ingress', 'Egress']}},
+            },
+        },
+    },
+}
+
+
+def _section_schema(field):
+    return {'type': 'object', 'required': [field], 'properties': {field: _SCHEMA['properties'][field]}}
+
+
+# One schema per validate_* method, so each still checks only its own part
+_SECTION_SCHEMAS = {
+    'basic_structure': {'type': 'object', 'required': _SCHEMA['required']},
+    'api_version': _section_schema('apiVersion'),
+    'kind': _section_schema('kind'),
+    'metadata': _section_schema('metadata'),
+    'spec': _section_schema('spec'),
+}
+
+# Compiled once at import; fastjsonschema generates plain Python code for
+# each schema, so a check is a single function call
+_VALIDATORS = {name: fastjsonschema.compile(schema) for name, schema in _SECTION_SCHEMAS.items()}
+
+
+def _is_one_of(value, choices):
+    """Membership test that treats unhashable YAML values (lists, maps) as absent"""
+    try:
+        return value in choices
+    except TypeError:
+        return False
+
 
 class ConfigValidator:
     """Example validator class for demonstration"""
     
-    def __init__(self):
-        self.required_fields = ['apiVersion', 'kind', 'metadata', 'spec']
-        self.valid_api_versions = ['networking.k8s.io/v1', 'networking.k8s.io/v1beta1']
-        self.valid_kinds = ['NetworkPolicy']
-        self.valid_policy_types = ['Ingress', 'Egress']
+    # Shared by every instance; built once when the class is defined.
+    # Sets make each membership test a single hash lookup
+    REQUIRED_FIELDS = ('apiVersion', 'kind', 'metadata', 'spec')
+    VALID_API_VERSIONS = frozenset({'networking.k8s.io/v1', 'networking.k8s.io/v1beta1'})
+    VALID_KINDS = frozenset({'NetworkPolicy'})
+    VALID_POLICY_TYPES = frozenset({'Ingress', 'Egress'})
+    _compiled = _VALIDATORS
+    
+    def _validate(self, section, config, check):
+        """
+        Validate config with the compiled schema for section
+        check is the matching hand-written rule set; it runs only when the
+        schema rejects config, to raise a descriptive error message.
+        test_schema_and_checks_agree keeps the two in step.
+        """
+        try:
+            self._compiled[section](config)
+        except fastjsonschema.JsonSchemaException as e:
+            check(config)
+            raise ConfigValidationError(e.message) from e
+        return True
     
     def validate_basic_structure(self, config):
         """Validate basic YAML structure"""
+        return self._validate('basic_structure', config, self._check_basic_structure)
+    
+    def validate_api_version(self, config):
+        """Validate API version field"""
+        return self._validate('api_version', config, self._check_api_version)
+    
+    def validate_kind(self, config):
+        """Validate kind field"""
+        return self._validate('kind', config, self._check_kind)
+    
+    def validate_metadata(self, config):
+        """Validate metadata section"""
+        return self._validate('metadata', config, self._check_metadata)
+    
+    def validate_spec(self, config):
+        """Validate spec section"""
+        return self._validate('spec', config, self._check_spec)
+    
+    def _check_basic_structure(self, config):
         if not isinstance(config, dict):
             raise ConfigValidationError("Configuration must be a dictionary")
         
-        missing_fields = [field for field in self.required_fields if field not in config]
+        missing_fields = [field for field in self.REQUIRED_FIELDS if field not in config]
         if missing_fields:
             raise ConfigValidationError(f"Missing required fields: {missing_fields}")
         
         return True
     
-    def validate_api_version(self, config):
-        """Validate API version field"""
+    def _check_api_version(self, config):
         api_version = config.get('apiVersion')
-        if api_version not in self.valid_api_versions:
+        if not _is_one_of(api_version, self.VALID_API_VERSIONS):
             raise ConfigValidationError(
-                f"Invalid apiVersion '{api_version}'. Must be one of: {self.valid_api_versions}"
+                f"Invalid apiVersion '{api_version}'. Must be one of: {sorted(self.VALID_API_VERSIONS)}"
             )
         return True
     
-    def validate_kind(self, config):
-        """Validate kind field"""
+    def _check_kind(self, config):
         kind = config.get('kind')
-        if kind not in self.valid_kinds:
-            raise ConfigValidationError(f"Invalid kind '{kind}'. Must be one of: {self.valid_kinds}")
+        if not _is_one_of(kind, self.VALID_KINDS):
+            raise ConfigValidationError(f"Invalid kind '{kind}'. Must be one of: {sorted(self.VALID_KINDS)}")
         return True
     
-    def validate_metadata(self, config):
-        """Validate metadata section"""
+    def _check_metadata(self, config):
         metadata = config.get('metadata', {})
         
         if not isinstance(metadata, dict):
@@ -76,8 +163,7 @@ class ConfigValidator:
         
         return True
     
-    def validate_spec(self, config):
-        """Validate spec section"""
+    def _check_spec(self, config):
         spec = config.get('spec', {})
         
         if not isinstance(spec, dict):
@@ -97,14 +183,14 @@ class ConfigValidator:
             if not isinstance(policy_types, list):
                 raise ConfigValidationError("spec.policyTypes must be a list")
             
-            invalid_types = [pt for pt in policy_types if pt not in self.valid_policy_types]
+            invalid_types = [pt for pt in policy_types if not _is_one_of(pt, self.VALID_POLICY_TYPES)]
             if invalid_types:
                 raise ConfigValidationError(f"Invalid policyTypes: {invalid_types}")
         
         return True
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def validator():
     """Fixture providing a config validator instance"""
     return ConfigValidator()
@@ -257,7 +343,7 @@ def test_spec_validation_errors(validator, valid_config):
     assert "Invalid policyTypes" in str(exc_info.value)
 
 
-def test_file_validation_workflow():
+def test_file_validation_workflow(validator):
     """Test complete file validation workflow"""
     # Create valid YAML file
     valid_data = {
@@ -276,7 +362,6 @@ def test_file_validation_workflow():
         with open(valid_file, 'r') as f:
             config = yaml.safe_load(f)
         
-        validator = ConfigValidator()
         assert validator.validate_basic_structure(config) is True
         assert validator.validate_metadata(config) is True
         assert validator.validate_spec(config) is True
@@ -337,7 +422,7 @@ def test_batch_validation():
     assert "Invalid apiVersion" in last_result[2]  # Error message
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_config_files():
     """Fixture that creates temporary config files for testing"""
     files = {}
@@ -385,10 +470,8 @@ def test_file_validation_with_fixture(sample_config_files):
         manager.validate_network_policy(invalid_config)
 
 
-def test_validation_error_messages():
+def test_validation_error_messages(validator):
     """Test that validation error messages are descriptive"""
-    validator = ConfigValidator()
-    
     test_cases = [
         ({}, "Missing required fields"),
         ({'apiVersion': 'invalid'}, "Invalid apiVersion"),
@@ -436,6 +519,66 @@ def test_name_validation_parametrized(validator, valid_config, invalid_name):
             validator.validate_metadata(config)
 
 
+_AGREEMENT_CASES = [
+    pytest.param('basic_structure', {'apiVersion': 1, 'kind': 1, 'metadata': 1, 'spec': 1}, True, id="basic-all-fields"),
+    pytest.param('basic_structure', {}, False, id="basic-empty"),
+    pytest.param('basic_structure', {'apiVersion': 1, 'kind': 1, 'metadata': 1}, False, id="basic-missing-spec"),
+    pytest.param('basic_structure', ['apiVersion'], False, id="basic-not-a-dict"),
+    pytest.param('api_version', {'apiVersion': 'networking.k8s.io/v1'}, True, id="api-v1"),
+    pytest.param('api_version', {'apiVersion': 'networking.k8s.io/v1beta1'}, True, id="api-v1beta1"),
+    pytest.param('api_version', {'apiVersion': 'apps/v1'}, False, id="api-wrong"),
+    pytest.param('api_version', {'apiVersion': None}, False, id="api-none"),
+    pytest.param('api_version', {'apiVersion': ['networking.k8s.io/v1']}, False, id="api-list"),
+    pytest.param('api_version', {}, False, id="api-missing"),
+    pytest.param('kind', {'kind': 'NetworkPolicy'}, True, id="kind-valid"),
+    pytest.param('kind', {'kind': 'networkpolicy'}, False, id="kind-wrong-case"),
+    pytest.param('kind', {'kind': {}}, False, id="kind-mapping"),
+    pytest.param('metadata', {'metadata': {'name': 'a'}}, True, id="name-single-char"),
+    pytest.param('metadata', {'metadata': {'name': '123-name.v1'}}, True, id="name-dots-dashes"),
+    pytest.param('metadata', {'metadata': {'name': '.hidden'}}, True, id="name-leading-dot"),
+    pytest.param('metadata', {'metadata': {'name': 'café2'}}, True, id="name-non-ascii-letter"),
+    pytest.param('metadata', {'metadata': {'name': 'x²'}}, True, id="name-superscript-digit"),
+    pytest.param('metadata', {'metadata': {'name': ''}}, False, id="name-empty"),
+    pytest.param('metadata', {'metadata': {'name': '   '}}, False, id="name-whitespace"),
+    pytest.param('metadata', {'metadata': {'name': 'a_b'}}, False, id="name-underscore"),
+    pytest.param('metadata', {'metadata': {'name': 'a b'}}, False, id="name-space"),
+    pytest.param('metadata', {'metadata': {'name': 'a!'}}, False, id="name-punctuation"),
+    pytest.param('metadata', {'metadata': {'name': '-a'}}, False, id="name-leading-dash"),
+    pytest.param('metadata', {'metadata': {'name': 'a-'}}, False, id="name-trailing-dash"),
+    pytest.param('metadata', {'metadata': {'name': 'a\n'}}, False, id="name-trailing-newline"),
+    pytest.param('metadata', {'metadata': {'name': 123}}, False, id="name-not-a-string"),
+    pytest.param('metadata', {'metadata': {}}, False, id="name-missing"),
+    pytest.param('metadata', {'metadata': 'name'}, False, id="metadata-not-a-dict"),
+    pytest.param('metadata', {}, False, id="metadata-missing"),
+    pytest.param('spec', {'spec': {'podSelector': {}}}, True, id="spec-minimal"),
+    pytest.param('spec', {'spec': {'podSelector': {}, 'policyTypes': ['Ingress', 'Egress']}}, True, id="spec-policy-types"),
+    pytest.param('spec', {'spec': {}}, False, id="spec-no-selector"),
+    pytest.param('spec', {'spec': {'podSelector': []}}, False, id="spec-selector-list"),
+    pytest.param('spec', {'spec': {'podSelector': {}, 'policyTypes': 'Ingress'}}, False, id="spec-types-string"),
+    pytest.param('spec', {'spec': {'podSelector': {}, 'policyTypes': ['Other']}}, False, id="spec-types-invalid"),
+    pytest.param('spec', {'spec': {'podSelector': {}, 'policyTypes': [['Ingress']]}}, False, id="spec-types-nested"),
+    pytest.param('spec', {'spec': ['podSelector']}, False, id="spec-not-a-dict"),
+]
+
+
+@pytest.mark.parametrize("section, config, expected", _AGREEMENT_CASES)
+def test_schema_and_checks_agree(validator, section, config, expected):
+    """The compiled schema and the hand-written checks accept the same inputs"""
+    try:
+        _VALIDATORS[section](config)
+        schema_ok = True
+    except fastjsonschema.JsonSchemaException:
+        schema_ok = False
+    
+    try:
+        checks_ok = getattr(validator, f'_check_{section}')(config)
+    except ConfigValidationError:
+        checks_ok = False
+    
+    assert schema_ok is expected
+    assert checks_ok is expected
+
+
 def test_complex_validation_scenario():
     """Test a complex validation scenario with multiple issues"""
     complex_config = {
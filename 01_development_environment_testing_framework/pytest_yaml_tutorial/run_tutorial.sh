@@ -89,9 +89,9 @@ setup_virtual_environment() {
     source venv/bin/activate
     
     echo "Installing dependencies..."
-    pip install --quiet pytest pytest-cov pyyaml
+    pip install --quiet pytest pytest-cov pyyaml fastjsonschema
     
-    print_success "Dependencies installed: pytest, pytest-cov, pyyaml"
+    print_success "Dependencies installed: pytest, pytest-cov, pyyaml, fastjsonschema"
 }
 
 run_step() {